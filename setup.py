@@ -50,6 +50,14 @@ setup(
             "plotly>=5.0.0",
             "bokeh>=2.4.0",
         ],
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "fast": [
+            "numba>=0.56.0",
+            "numexpr>=2.8.0",
+            "orjson>=3.6.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -431,7 +431,7 @@ class WeatherPlotter:
         """
         client = self._get_data_client(data_source)
 
-        return client.get_weather_data(
+        return client.get_weather_data_cached(
             latitude=airport["latitude"],
             longitude=airport["longitude"],
             start_time=start_time,
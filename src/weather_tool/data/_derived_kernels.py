@@ -0,0 +1,184 @@
+"""
+Numerical kernels for derived weather variables.
+
+Wind chill, heat index and Magnus dew point are computed in a single fused
+pass. When Numba is installed the kernel is JIT-compiled and parallelized over
+rows; otherwise an equivalent vectorized NumPy implementation is used, with the
+dew point evaluated by numexpr when it is available.
+
+Inputs and outputs are float32 arrays. The compiled kernel evaluates wind
+chill and heat index in double precision and rounds once when storing the
+result; the dew point uses the float32 Magnus constants and stays in single
+precision on every path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    prange = range
+    HAS_NUMBA = False
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Magnus formula constants, float32 so float32 inputs are never upcast
+MAGNUS_A = np.float32(17.27)
+MAGNUS_B = np.float32(237.7)
+# Percent to fraction as a multiplication (cheaper than dividing by 100)
+INV_100 = np.float32(0.01)
+
+# Whole Magnus dew-point formula as one numexpr expression (no temporaries)
+_DEW_POINT_EXPR = (
+    "(b * ((a * T) / (b + T) + log(R * c)))" " / (a - ((a * T) / (b + T) + log(R * c)))"
+)
+
+
+def _derived_kernel(
+    temp: np.ndarray,
+    wind: np.ndarray,
+    rh: np.ndarray,
+    out_wc: np.ndarray,
+    out_hi: np.ndarray,
+    out_dp: np.ndarray,
+    do_wc: bool,
+    do_hi: bool,
+    do_dp: bool,
+) -> None:
+    """Row-wise kernel compiled by Numba (see compute_derived)."""
+    for i in prange(temp.shape[0]):
+        t = temp[i]
+
+        # Wind chill (valid for T <= 10°C and wind >= 4.8 km/h)
+        if do_wc:
+            wind_kmh = wind[i] * 3.6
+            if t <= 10.0 and wind_kmh >= 4.8:
+                w = wind_kmh**0.16
+                out_wc[i] = 13.12 + 0.6215 * t - 11.37 * w + 0.3965 * t * w
+
+        # Heat index (valid for T >= 80°F and RH >= 40%)
+        if do_hi:
+            r = rh[i]
+            temp_f = t * 9.0 / 5.0 + 32.0
+            if temp_f >= 80.0 and r >= 40.0:
+                hi = (
+                    -42.379
+                    + 2.04901523 * temp_f
+                    + 10.14333127 * r
+                    - 0.22475541 * temp_f * r
+                    - 6.83783e-3 * temp_f * temp_f
+                    - 5.481717e-2 * r * r
+                    + 1.22874e-3 * temp_f * temp_f * r
+                    + 8.5282e-4 * temp_f * r * r
+                    - 1.99e-6 * temp_f * temp_f * r * r
+                )
+                out_hi[i] = (hi - 32.0) * 5.0 / 9.0
+
+        # Magnus dew point
+        if do_dp:
+            alpha = (MAGNUS_A * t) / (MAGNUS_B + t) + np.log(rh[i] * INV_100)
+            out_dp[i] = (MAGNUS_B * alpha) / (MAGNUS_A - alpha)
+
+
+def _compute_derived_numpy(
+    temp: np.ndarray,
+    wind: np.ndarray,
+    rh: np.ndarray,
+    out_wc: np.ndarray,
+    out_hi: np.ndarray,
+    out_dp: np.ndarray,
+    do_wc: bool,
+    do_hi: bool,
+    do_dp: bool,
+) -> None:
+    """Vectorized NumPy fallback with the same contract as the Numba kernel."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if do_wc:
+            wind_kmh = wind * 3.6
+            mask = (temp <= 10) & (wind_kmh >= 4.8)
+            t = temp[mask]
+            w = wind_kmh[mask] ** 0.16
+            out_wc[mask] = 13.12 + 0.6215 * t - 11.37 * w + 0.3965 * t * w
+
+        if do_hi:
+            temp_f = temp * 9 / 5 + 32
+            mask = (temp_f >= 80) & (rh >= 40)
+            tf = temp_f[mask]
+            r = rh[mask]
+            hi = (
+                -42.379
+                + 2.04901523 * tf
+                + 10.14333127 * r
+                - 0.22475541 * tf * r
+                - 6.83783e-3 * tf**2
+                - 5.481717e-2 * r**2
+                + 1.22874e-3 * tf**2 * r
+                + 8.5282e-4 * tf * r**2
+                - 1.99e-6 * tf**2 * r**2
+            )
+            out_hi[mask] = (hi - 32) * 5 / 9
+
+        if do_dp:
+            if numexpr is not None:
+                # float32 constants keep the expression in single precision so
+                # numexpr can write straight into the float32 output
+                numexpr.evaluate(
+                    _DEW_POINT_EXPR,
+                    local_dict={
+                        "T": temp,
+                        "R": rh,
+                        "a": MAGNUS_A,
+                        "b": MAGNUS_B,
+                        "c": INV_100,
+                    },
+                    out=out_dp,
+                )
+            else:
+                alpha = (MAGNUS_A * temp) / (MAGNUS_B + temp) + np.log(rh * INV_100)
+                out_dp[:] = (MAGNUS_B * alpha) / (MAGNUS_A - alpha)
+
+
+if HAS_NUMBA:
+    # Fast-math flags without nnan/ninf: missing observations are NaN and the
+    # validity masks must keep treating NaN comparisons as False
+    compute_derived = njit(
+        parallel=True,
+        fastmath={"contract", "afn", "arcp", "reassoc", "nsz"},
+        cache=True,
+    )(_derived_kernel)
+else:
+    compute_derived = _compute_derived_numpy
+
+
+_warmed_up = False
+
+
+def warmup() -> None:
+    """Compile (or load from the on-disk cache) the kernel for float32 inputs.
+
+    Called when a weather data client is constructed so the first
+    standardization doesn't pay the JIT cost. Only the first call does any
+    work, and it is a no-op without Numba.
+    """
+    global _warmed_up
+    if _warmed_up or not HAS_NUMBA:
+        return
+    _warmed_up = True
+
+    values = np.zeros(1, dtype=np.float32)
+    compute_derived(
+        values,
+        values,
+        values,
+        values.copy(),
+        values.copy(),
+        values.copy(),
+        True,
+        True,
+        True,
+    )
@@ -5,15 +5,278 @@ This module defines the interfaces that all weather data clients must implement,
 making it easy to add new data sources while maintaining consistency.
 """
 
+import asyncio
+import bisect
+import json
+import logging
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    as_completed,
+)
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._derived_kernels import compute_derived, warmup
+
+# JSON decoder for HTTP responses (orjson is optional and much faster)
+_json_loads: Callable[[Any], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session so every client reuses the same keep-alive connection pool
+_SESSION = requests.Session()
+_SESSION_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+    ),
+)
+_SESSION.mount("http://", _SESSION_ADAPTER)
+_SESSION.mount("https://", _SESSION_ADAPTER)
+
+
+# Concurrency limits for the optional aiohttp fetch path
+_AIOHTTP_LIMIT = 100
+_AIOHTTP_LIMIT_PER_HOST = 10
+
+_aiohttp_session: Optional[Any] = None
+_aiohttp_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_aiohttp_session(timeout: float = 30) -> Any:
+    """Get the shared aiohttp session for the running event loop.
+
+    aiohttp is an optional dependency; it is imported lazily so the synchronous
+    clients work without it.
+
+    Args:
+        timeout: Total request timeout in seconds
+
+    Returns:
+        aiohttp.ClientSession bound to the current event loop
+    """
+    global _aiohttp_session, _aiohttp_loop
+
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise RuntimeError(
+            "Async weather data fetching requires aiohttp (pip install aiohttp)"
+        ) from e
+
+    loop = asyncio.get_running_loop()
+    if _aiohttp_session is None or _aiohttp_session.closed or _aiohttp_loop is not loop:
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=_AIOHTTP_LIMIT,
+                limit_per_host=_AIOHTTP_LIMIT_PER_HOST,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=timeout, connect=10),
+        )
+        _aiohttp_loop = loop
+
+    return _aiohttp_session
+
+
+def close_all() -> None:
+    """Close the shared HTTP session and release pooled connections."""
+    _SESSION.close()
+
+
+async def aclose_all() -> None:
+    """Close the shared aiohttp session, if one was created."""
+    global _aiohttp_session, _aiohttp_loop
+
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+    _aiohttp_loop = None
+
+
+# Default TTL for cached weather data when a source has no update frequency
+_DEFAULT_CACHE_TTL = 900.0
+
+_FREQUENCY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)\s*$")
+_FREQUENCY_UNIT_SECONDS = {
+    "s": 1,
+    "sec": 1,
+    "min": 60,
+    "t": 60,
+    "h": 3600,
+    "d": 86400,
+}
+
+
+def _parse_frequency_seconds(frequency: Optional[str]) -> float:
+    """Convert an update frequency string (e.g. "15min", "6H") to seconds.
+
+    Args:
+        frequency: Frequency string from DataSourceInfo.update_frequency
+
+    Returns:
+        Number of seconds, or the default TTL if the string is missing or unknown
+    """
+    if not frequency:
+        return _DEFAULT_CACHE_TTL
+
+    match = _FREQUENCY_PATTERN.match(frequency)
+    if not match:
+        return _DEFAULT_CACHE_TTL
+
+    unit_seconds = _FREQUENCY_UNIT_SECONDS.get(match.group(2).lower())
+    if unit_seconds is None:
+        return _DEFAULT_CACHE_TTL
+
+    return float(match.group(1)) * unit_seconds
+
+
+# Variable name mappings for different sources, in order of preference
+_VAR_MAPPINGS: Dict[str, List[str]] = {
+    # Temperature
+    "temperature": [
+        "air_temperature_2m",
+        "temperature_2m",
+        "temp",
+        "t2m",
+        "temperature",
+    ],
+    "pressure": [
+        "air_pressure_at_sea_level",
+        "surface_air_pressure",
+        "msl",
+        "slp",
+        "pressure",
+    ],
+    "humidity": [
+        "relative_humidity_2m",
+        "relative_humidity",
+        "rh2m",
+        "humidity",
+    ],
+    "wind_speed": ["wind_speed_10m", "wind_speed", "ws10m"],
+    "wind_direction": ["wind_from_direction_10m", "wind_direction", "wd10m"],
+    "precipitation": ["precipitation_amount", "precip", "tp", "precipitation"],
+    "cloud_cover": ["cloud_area_fraction", "cloudiness", "cc", "cloud_cover"],
+    "weather_symbol": ["symbol_code", "weather_symbol", "weather_code"],
+    "visibility": ["visibility", "vis"],
+    "dew_point": ["dew_point_temperature_2m", "dew_point", "td2m"],
+    "uv_index": ["ultraviolet_index", "uv_index", "uvi"],
+    "cloud_high": ["high_type_cloud_area_fraction", "cloud_high"],
+    "cloud_medium": ["medium_type_cloud_area_fraction", "cloud_medium"],
+    "cloud_low": ["low_type_cloud_area_fraction", "cloud_low"],
+    "fog": ["fog_area_fraction", "fog"],
+}
+
+# Inverse lookup: source column name -> (standardized name, preference rank)
+_SOURCE_TO_STD: Dict[str, Tuple[str, int]] = {
+    source_name: (std_name, rank)
+    for std_name, source_names in _VAR_MAPPINGS.items()
+    for rank, source_name in enumerate(source_names)
+}
+_STD_ORDER: Dict[str, int] = {name: i for i, name in enumerate(_VAR_MAPPINGS)}
+
+# Per-row dataclasses use __slots__ where supported (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Standardized variable names every client can provide
+_AVAILABLE_VARIABLES: Tuple[str, ...] = (
+    "temperature",
+    "pressure",
+    "humidity",
+    "wind_speed",
+    "wind_direction",
+    "precipitation",
+    "cloud_cover",
+    "weather_symbol",
+    "visibility",
+    "dew_point",
+    "uv_index",
+    "cloud_high",
+    "cloud_medium",
+    "cloud_low",
+    "fog",
+)
+
+# Cloud coverage variables stored as fractions (0-1)
+_CLOUD_VARIABLES: Tuple[str, ...] = (
+    "cloud_cover",
+    "cloud_high",
+    "cloud_medium",
+    "cloud_low",
+    "fog",
+)
+
+# Standardized variables stored as-is rather than in the numeric block
+_NON_NUMERIC_VARIABLES = frozenset({"weather_symbol"})
+
+# Standardized inputs each derived variable is computed from
+_DERIVED_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "wind_chill": ("temperature", "wind_speed"),
+    "heat_index": ("temperature", "humidity"),
+    "dew_point": ("temperature", "humidity"),
+}
+
+# Measurements are stored as float32: ~7 significant digits is well beyond
+# sensor precision and halves memory traffic compared to float64
+_MEASUREMENT_DTYPE = np.float32
+
+# Unit conversion constants, typed to avoid upcasting float32 columns
+_KELVIN_OFFSET = np.float32(273.15)
+_PA_PER_HPA = np.float32(100.0)
+_PERCENT = np.float32(100.0)
+# Values above these can only be in Kelvin / Pa
+_KELVIN_THRESHOLD = np.float32(200.0)
+_PA_THRESHOLD = np.float32(50000.0)
+
+
+def _naive_timestamp(value: datetime) -> pd.Timestamp:
+    """Convert a datetime to a timezone-naive UTC timestamp for index slicing."""
+    timestamp: pd.Timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp
+
+
+def _nan_buffer(size: int) -> np.ndarray:
+    """Allocate a NaN-filled measurement array."""
+    return np.full(size, np.nan, dtype=_MEASUREMENT_DTYPE)
+
+
+def _copy_on_write_enabled() -> bool:
+    """Check whether pandas Copy-on-Write semantics are active."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # option not available (pandas < 2.0)
+        return False
 
 
 class DataSourceType(Enum):
@@ -34,7 +297,7 @@ class DataQuality(Enum):
     SYNTHETIC = "synthetic"  # Generated/test data
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WeatherDataPoint:
     """Standardized weather data point."""
 
@@ -65,7 +328,159 @@ class WeatherDataPoint:
     model: Optional[str] = None
 
 
-@dataclass
+# Numeric WeatherDataPoint fields stored as columns in WeatherDataPointBatch
+_POINT_FLOAT_FIELDS: Tuple[str, ...] = (
+    "temperature",
+    "pressure",
+    "humidity",
+    "wind_speed",
+    "wind_direction",
+    "precipitation",
+    "cloud_cover",
+    "visibility",
+    "dew_point",
+    "uv_index",
+    "cloud_high",
+    "cloud_medium",
+    "cloud_low",
+    "fog",
+)
+
+
+class WeatherDataPointBatch:
+    """Columnar (struct-of-arrays) container for many weather data points.
+
+    Each field is a preallocated NumPy array, so filling N rows costs one
+    allocation per column instead of N WeatherDataPoint objects.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        data_quality: DataQuality = DataQuality.REAL_TIME,
+        source: Optional[str] = None,
+        model: Optional[str] = None,
+    ):
+        """Initialize an empty batch.
+
+        Args:
+            size: Number of rows
+            data_quality: Quality indicator shared by all rows
+            source: Data source name shared by all rows
+            model: Model name shared by all rows
+        """
+        self.size = size
+        self.data_quality = data_quality
+        self.source = source
+        self.model = model
+
+        self.timestamp = np.empty(size, dtype="datetime64[ns]")
+        self.weather_symbol = np.full(size, None, dtype=object)
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.full(size, np.nan, dtype=_MEASUREMENT_DTYPE)
+            for name in _POINT_FLOAT_FIELDS
+        }
+
+    def __len__(self) -> int:
+        """Number of rows in the batch."""
+        return self.size
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Expose numeric columns as attributes (e.g. batch.temperature)."""
+        columns: Dict[str, np.ndarray] = self.__dict__.get("columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def set_record(self, index: int, record: Dict[str, Any]) -> None:
+        """Write one row from a dict keyed by WeatherDataPoint field names.
+
+        Args:
+            index: Row position
+            record: Mapping with "timestamp" and any measured fields
+        """
+        self.timestamp[index] = np.datetime64(record["timestamp"], "ns")
+        self.weather_symbol[index] = record.get("weather_symbol")
+        for name, column in self.columns.items():
+            value = record.get(name)
+            if value is not None:
+                column[index] = value
+
+    def set_point(self, index: int, point: WeatherDataPoint) -> None:
+        """Write one row from a WeatherDataPoint.
+
+        Args:
+            index: Row position
+            point: Data point to store
+        """
+        self.timestamp[index] = np.datetime64(point.timestamp, "ns")
+        self.weather_symbol[index] = point.weather_symbol
+        for name, column in self.columns.items():
+            value = getattr(point, name)
+            if value is not None:
+                column[index] = value
+
+    def get_point(self, index: int) -> WeatherDataPoint:
+        """Materialize a single row as a WeatherDataPoint.
+
+        Args:
+            index: Row position
+
+        Returns:
+            WeatherDataPoint with missing values as None
+        """
+        values: Dict[str, Optional[float]] = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            values[name] = None if np.isnan(value) else float(value)
+
+        return WeatherDataPoint(
+            timestamp=pd.Timestamp(self.timestamp[index]).to_pydatetime(),
+            weather_symbol=self.weather_symbol[index],
+            data_quality=self.data_quality,
+            source=self.source,
+            model=self.model,
+            **values,
+        )
+
+    @classmethod
+    def from_points(cls, points: Sequence[WeatherDataPoint]) -> "WeatherDataPointBatch":
+        """Build a batch from existing WeatherDataPoint objects.
+
+        Args:
+            points: Data points; metadata is taken from the first point
+
+        Returns:
+            Filled WeatherDataPointBatch
+        """
+        first = points[0] if points else None
+        batch = cls(
+            len(points),
+            data_quality=first.data_quality if first else DataQuality.REAL_TIME,
+            source=first.source if first else None,
+            model=first.model if first else None,
+        )
+        for index, point in enumerate(points):
+            batch.set_point(index, point)
+        return batch
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Wrap the columns in a DataFrame indexed by timestamp without copying.
+
+        Returns:
+            DataFrame with one column per field
+        """
+        data: Dict[str, np.ndarray] = dict(self.columns)
+        data["weather_symbol"] = self.weather_symbol
+        frame: pd.DataFrame = pd.DataFrame(
+            data,
+            index=pd.DatetimeIndex(self.timestamp, name="timestamp"),
+            copy=False,
+        )
+        return frame
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DataSourceInfo:
     """Information about a data source."""
 
@@ -85,6 +500,9 @@ class DataSourceInfo:
 class WeatherDataClient(ABC):
     """Abstract base class for all weather data clients."""
 
+    # Maximum number of cached query results kept per client
+    cache_max_size = 512
+
     def __init__(self, config: Any):
         """Initialize the client.
 
@@ -92,6 +510,12 @@ class WeatherDataClient(ABC):
             config: Configuration object
         """
         self.config = config
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[pd.DataFrame, float]]" = (
+            OrderedDict()
+        )
+
+        # Compile the derived-variable kernel before the first request needs it
+        warmup()
 
     @abstractmethod
     def get_weather_data(
@@ -116,6 +540,185 @@ class WeatherDataClient(ABC):
         """
         raise NotImplementedError
 
+    def get_weather_data_cached(
+        self,
+        latitude: float,
+        longitude: float,
+        start_time: datetime,
+        end_time: datetime,
+        variables: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Fetch weather data, reusing results for identical recent queries.
+
+        Results are kept in an in-process LRU cache whose TTL follows the
+        source's update frequency. Callers get their own copy, so modifying
+        it in place never changes the cached frame.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            start_time: Start time for data retrieval
+            end_time: End time for data retrieval
+            variables: List of weather variables to fetch
+
+        Returns:
+            DataFrame with standardized weather data
+        """
+        source_info = self.get_source_info()
+        key = (
+            source_info.name,
+            round(latitude, 4),
+            round(longitude, 4),
+            start_time.isoformat(),
+            end_time.isoformat(),
+            tuple(variables or ()),
+            source_info.time_resolution,
+        )
+
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None:
+            value, expires_at = cached
+            if now < expires_at:
+                self._cache.move_to_end(key)
+                return self._copy_cached(value)
+            del self._cache[key]
+
+        value = self.get_weather_data(
+            latitude, longitude, start_time, end_time, variables
+        )
+
+        ttl = _parse_frequency_seconds(source_info.update_frequency)
+        self._cache[key] = (value, now + ttl)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_max_size:
+            self._cache.popitem(last=False)
+
+        return self._copy_cached(value)
+
+    @staticmethod
+    def _copy_cached(df: pd.DataFrame) -> pd.DataFrame:
+        """Copy a cached DataFrame for the caller.
+
+        Under pandas Copy-on-Write a shallow copy already keeps in-place
+        edits away from the cache; without it the data must be copied.
+        """
+        result: pd.DataFrame = df.copy(deep=not _copy_on_write_enabled())
+        return result
+
+    def clear_data_cache(self) -> None:
+        """Drop all cached weather data results."""
+        self._cache.clear()
+
+    def get_weather_data_batch(
+        self, queries: Sequence[Tuple[Any, ...]]
+    ) -> List[pd.DataFrame]:
+        """Fetch several queries, merging overlapping requests into one call.
+
+        Queries for the same location (rounded to 0.01°) and variables are
+        grouped, their overlapping time windows merged, and each merged window
+        fetched once. Results are sliced back to each query's own window.
+
+        Args:
+            queries: Sequence of (latitude, longitude, start_time, end_time[, variables])
+                tuples, as accepted by get_weather_data
+
+        Returns:
+            List of DataFrames in the same order as queries
+        """
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, query in enumerate(queries):
+            latitude, longitude = query[0], query[1]
+            variables = query[4] if len(query) > 4 else None
+            key = (round(latitude, 2), round(longitude, 2), tuple(variables or ()))
+            groups.setdefault(key, []).append(index)
+
+        # Timezone-naive UTC bounds so naive and aware datetimes compare
+        bounds = [
+            (_naive_timestamp(query[2]), _naive_timestamp(query[3]))
+            for query in queries
+        ]
+
+        results: List[Optional[pd.DataFrame]] = [None] * len(queries)
+        for indices in groups.values():
+            indices.sort(key=lambda i: bounds[i][0])
+            first = queries[indices[0]]
+            latitude, longitude = first[0], first[1]
+            variables = first[4] if len(first) > 4 else None
+
+            # Sweep over start-sorted queries, merging overlapping windows
+            merged: List[List[Any]] = []
+            for index in indices:
+                start, end = bounds[index]
+                if merged and start <= bounds[merged[-1][1]][1]:
+                    window = merged[-1]
+                    if end > bounds[window[1]][1]:
+                        window[1] = index
+                    window[2].append(index)
+                else:
+                    merged.append([index, index, [index]])
+
+            for start_index, end_index, members in merged:
+                df = self.get_weather_data(
+                    latitude,
+                    longitude,
+                    queries[start_index][2],
+                    queries[end_index][3],
+                    variables,
+                )
+                for index in members:
+                    start, end = bounds[index]
+                    results[index] = df.loc[start:end]
+
+        return [df for df in results if df is not None]
+
+    async def aget_weather_data(
+        self,
+        latitude: float,
+        longitude: float,
+        start_time: datetime,
+        end_time: datetime,
+        variables: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Async variant of get_weather_data.
+
+        The default runs the synchronous implementation in a worker thread;
+        HTTP clients override this with a native aiohttp request.
+
+        Returns:
+            DataFrame with standardized weather data
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.get_weather_data,
+                latitude,
+                longitude,
+                start_time,
+                end_time,
+                variables,
+            ),
+        )
+
+    async def aget_many(self, points: Sequence[Tuple[Any, ...]]) -> List[pd.DataFrame]:
+        """Fetch weather data for several queries concurrently.
+
+        Args:
+            points: Sequence of (latitude, longitude, start_time, end_time[, variables])
+                tuples, as accepted by aget_weather_data
+
+        Returns:
+            List of DataFrames in the same order as points
+        """
+        semaphore = asyncio.Semaphore(_AIOHTTP_LIMIT_PER_HOST)
+
+        async def fetch(point: Tuple[Any, ...]) -> pd.DataFrame:
+            async with semaphore:
+                return await self.aget_weather_data(*point)
+
+        return list(await asyncio.gather(*(fetch(point) for point in points)))
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test if the data source is available.
@@ -134,29 +737,13 @@ class WeatherDataClient(ABC):
         """
         raise NotImplementedError
 
-    def get_available_variables(self) -> List[str]:
+    def get_available_variables(self) -> Sequence[str]:
         """Get list of available weather variables.
 
         Returns:
-            List of standardized variable names
+            Standardized variable names (shared, read-only tuple)
         """
-        return [
-            "temperature",
-            "pressure",
-            "humidity",
-            "wind_speed",
-            "wind_direction",
-            "precipitation",
-            "cloud_cover",
-            "weather_symbol",
-            "visibility",
-            "dew_point",
-            "uv_index",
-            "cloud_high",
-            "cloud_medium",
-            "cloud_low",
-            "fog",
-        ]
+        return _AVAILABLE_VARIABLES
 
     def validate_coordinates(self, latitude: float, longitude: float) -> bool:
         """Validate coordinate values.
@@ -189,23 +776,37 @@ class HTTPWeatherClient(WeatherDataClient):
     def __init__(self, config: Any):
         """Initialize HTTP client."""
         super().__init__(config)
-        self.session = requests.Session()
         self._setup_session()
 
     def _setup_session(self) -> None:
-        """Set up HTTP session with headers and timeouts."""
-        self.session.headers.update(
-            {
-                "User-Agent": getattr(self.config, "user_agent", "weather-tool/1.0"),
-                "Accept": "application/json",
-            }
-        )
+        """Set up HTTP session with headers and timeouts.
+
+        The session is shared across all clients so connections are pooled;
+        headers and timeout are kept per instance and passed on each request.
+        """
+        self.session = _SESSION
+        self._headers: Dict[str, str] = {
+            "User-Agent": getattr(self.config, "user_agent", "weather-tool/1.0"),
+            "Accept": "application/json",
+        }
         self.timeout = getattr(self.config, "timeout", 30)
+        # Decode response bodies with self._loads(response.content)
+        self._loads = _json_loads
 
-    def __del__(self) -> None:
-        """Clean up session."""
-        if hasattr(self, "session"):
-            self.session.close()
+    async def _aget_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """GET a JSON document through the shared aiohttp session.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON payload
+        """
+        session = _get_aiohttp_session(self.timeout)
+        async with session.get(url, params=params, headers=self._headers) as response:
+            response.raise_for_status()
+            return self._loads(await response.read())
 
 
 class FileWeatherClient(WeatherDataClient):
@@ -234,174 +835,212 @@ class WeatherDataProcessor:
 
     @staticmethod
     def standardize_dataframe(
-        df: pd.DataFrame, source_info: DataSourceInfo
+        df: pd.DataFrame,
+        source_info: DataSourceInfo,
+        wanted: Optional[Set[str]] = None,
     ) -> pd.DataFrame:
         """Convert any weather DataFrame to standardized format.
 
         Args:
             df: Input DataFrame with weather data
             source_info: Information about the data source
+            wanted: Standardized variables requested by the caller. Derived
+                variables not in this set are not computed (None = all)
 
         Returns:
             DataFrame with standardized column names and units
         """
+        # Map variables in a single pass over the columns, keeping the most
+        # preferred source name for each standardized variable
+        best: Dict[str, Tuple[int, str]] = {}
+        for name in df.columns:
+            mapping = _SOURCE_TO_STD.get(name)
+            if mapping is None:
+                continue
+            std_name, rank = mapping
+            if std_name not in best or rank < best[std_name][0]:
+                best[std_name] = (rank, name)
+
+        present: List[Tuple[str, str]] = [
+            (std_name, best[std_name][1])
+            for std_name in sorted(best, key=_STD_ORDER.__getitem__)
+        ]
+
+        # Copy numeric variables into one column-major (F-ordered) block so the
+        # DataFrame wraps it without further copies or block consolidation
+        numeric = [
+            (std_name, name)
+            for std_name, name in present
+            if std_name not in _NON_NUMERIC_VARIABLES
+        ]
+        buffer = np.empty((len(df), len(numeric)), dtype=_MEASUREMENT_DTYPE, order="F")
+        for i, (_, name) in enumerate(numeric):
+            buffer[:, i] = df[name].to_numpy(dtype=_MEASUREMENT_DTYPE, na_value=np.nan)
+
         # Create standardized DataFrame
-        standardized = pd.DataFrame(index=df.index)
-
-        # Variable name mappings for different sources
-        variable_mappings = {
-            # Temperature
-            "temperature": [
-                "air_temperature_2m",
-                "temperature_2m",
-                "temp",
-                "t2m",
-                "temperature",
-            ],
-            "pressure": [
-                "air_pressure_at_sea_level",
-                "surface_air_pressure",
-                "msl",
-                "slp",
-                "pressure",
-            ],
-            "humidity": [
-                "relative_humidity_2m",
-                "relative_humidity",
-                "rh2m",
-                "humidity",
-            ],
-            "wind_speed": ["wind_speed_10m", "wind_speed", "ws10m"],
-            "wind_direction": ["wind_from_direction_10m", "wind_direction", "wd10m"],
-            "precipitation": ["precipitation_amount", "precip", "tp", "precipitation"],
-            "cloud_cover": ["cloud_area_fraction", "cloudiness", "cc", "cloud_cover"],
-            "weather_symbol": ["symbol_code", "weather_symbol", "weather_code"],
-            "visibility": ["visibility", "vis"],
-            "dew_point": ["dew_point_temperature_2m", "dew_point", "td2m"],
-            "uv_index": ["ultraviolet_index", "uv_index", "uvi"],
-            "cloud_high": ["high_type_cloud_area_fraction", "cloud_high"],
-            "cloud_medium": ["medium_type_cloud_area_fraction", "cloud_medium"],
-            "cloud_low": ["low_type_cloud_area_fraction", "cloud_low"],
-            "fog": ["fog_area_fraction", "fog"],
-        }
+        standardized = pd.DataFrame(
+            buffer,
+            index=df.index,
+            columns=[std_name for std_name, _ in numeric],
+            copy=False,
+        )
 
-        # Map variables
-        for std_name, possible_names in variable_mappings.items():
-            for name in possible_names:
-                if name in df.columns:
-                    standardized[std_name] = df[name]
-                    break
+        for std_name, name in present:
+            if std_name in _NON_NUMERIC_VARIABLES:
+                standardized[std_name] = df[name]
 
         # Convert units to standard
         standardized = WeatherDataProcessor._convert_units(standardized)
 
         # Add derived variables
-        standardized = WeatherDataProcessor._add_derived_variables(standardized)
+        standardized = WeatherDataProcessor._add_derived_variables(standardized, wanted)
 
         return standardized
 
+    @staticmethod
+    def _working_copy(df: pd.DataFrame) -> pd.DataFrame:
+        """Copy a DataFrame so column assignments don't reach the caller's frame.
+
+        Under pandas Copy-on-Write a shallow copy is enough: data is only
+        copied for blocks that are actually written. Without it, a deep copy
+        is still required.
+        """
+        working: pd.DataFrame = df.copy(deep=not _copy_on_write_enabled())
+        return working
+
+    @staticmethod
+    def _float_array(series: pd.Series) -> np.ndarray:
+        """Get a writable float32 copy of a column with missing values as NaN."""
+        return series.to_numpy(dtype=_MEASUREMENT_DTYPE, na_value=np.nan, copy=True)
+
+    @staticmethod
+    def _column_values(series: pd.Series) -> np.ndarray:
+        """Get a read-only view of a column's values for copying into a buffer.
+
+        Plain NumPy numeric columns are returned without conversion; extension
+        arrays (e.g. nullable floats) and object columns are converted with
+        missing values as NaN.
+        """
+        dtype = series.dtype
+        if not pd.api.types.is_extension_array_dtype(dtype) and dtype.kind in "fiu":
+            return series.to_numpy()
+        return series.to_numpy(dtype=_MEASUREMENT_DTYPE, na_value=np.nan)
+
     @staticmethod
     def _convert_units(df: pd.DataFrame) -> pd.DataFrame:
         """Convert units to standard format."""
-        df_converted = df.copy()
+        df_converted = WeatherDataProcessor._working_copy(df)
 
         # Temperature: Kelvin to Celsius
         if "temperature" in df_converted.columns:
-            temp_col = df_converted["temperature"]
-            if temp_col.min() > 200:  # Likely in Kelvin
-                df_converted["temperature"] = temp_col - 273.15
+            # Convert in one masked pass instead of reducing the column first
+            temp = WeatherDataProcessor._float_array(df_converted["temperature"])
+            np.subtract(temp, _KELVIN_OFFSET, out=temp, where=temp > _KELVIN_THRESHOLD)
+            df_converted["temperature"] = temp
 
         # Pressure: Pa to hPa
         if "pressure" in df_converted.columns:
-            pressure_col = df_converted["pressure"]
-            if pressure_col.min() > 50000:  # Likely in Pa
-                df_converted["pressure"] = pressure_col / 100
+            pressure = WeatherDataProcessor._float_array(df_converted["pressure"])
+            np.divide(
+                pressure, _PA_PER_HPA, out=pressure, where=pressure > _PA_THRESHOLD
+            )
+            df_converted["pressure"] = pressure
 
         # Ensure precipitation is non-negative
         if "precipitation" in df_converted.columns:
-            df_converted["precipitation"] = df_converted["precipitation"].clip(lower=0)
+            precip = WeatherDataProcessor._float_array(df_converted["precipitation"])
+            np.maximum(precip, 0, out=precip)
+            df_converted["precipitation"] = precip
 
         # Convert cloud coverage from percentage to fraction (0-1) if needed
-        cloud_vars = ["cloud_cover", "cloud_high", "cloud_medium", "cloud_low", "fog"]
-        for var in cloud_vars:
-            if var in df_converted.columns:
-                cloud_col = df_converted[var]
-                # If values are > 1, assume they're percentages and convert to fractions
-                if cloud_col.max() > 1:
-                    df_converted[var] = cloud_col / 100.0
-                # Ensure cloud fractions are between 0 and 1
-                df_converted[var] = df_converted[var].clip(0, 1)
+        present = [var for var in _CLOUD_VARIABLES if var in df_converted.columns]
+        if present:
+            # Fill one 2-D block directly (no per-column temporaries)
+            values = np.empty(
+                (len(df_converted), len(present)), dtype=_MEASUREMENT_DTYPE
+            )
+            for i, var in enumerate(present):
+                values[:, i] = WeatherDataProcessor._column_values(df_converted[var])
+            # If values are > 1, assume they're percentages and convert to fractions
+            is_percent = np.fmax.reduce(values, axis=0) > 1
+            np.divide(values, _PERCENT, out=values, where=is_percent)
+            # Ensure cloud fractions are between 0 and 1
+            np.clip(values, 0, 1, out=values)
+            for i, var in enumerate(present):
+                df_converted[var] = values[:, i]
 
         return df_converted
 
     @staticmethod
-    def _add_derived_variables(df: pd.DataFrame) -> pd.DataFrame:
-        """Add derived weather variables."""
-        df_derived = df.copy()
-
-        # Wind chill
-        if "temperature" in df_derived.columns and "wind_speed" in df_derived.columns:
-            temp = df_derived["temperature"]
-            wind_kmh = df_derived["wind_speed"] * 3.6  # Convert m/s to km/h
-
-            # Wind chill formula (valid for T <= 10°C and wind >= 4.8 km/h)
-            mask = (temp <= 10) & (wind_kmh >= 4.8)
-            if mask.any():
-                wind_chill = (
-                    13.12
-                    + 0.6215 * temp
-                    - 11.37 * (wind_kmh**0.16)
-                    + 0.3965 * temp * (wind_kmh**0.16)
-                )
-                df_derived.loc[mask, "wind_chill"] = wind_chill[mask]
-
-        # Heat index
-        if "temperature" in df_derived.columns and "humidity" in df_derived.columns:
-            temp_f = df_derived["temperature"] * 9 / 5 + 32  # Convert to Fahrenheit
-            rh = df_derived["humidity"]
-
-            # Heat index formula (valid for T >= 80°F and RH >= 40%)
-            mask = (temp_f >= 80) & (rh >= 40)
-            if mask.any():
-                hi = (
-                    -42.379
-                    + 2.04901523 * temp_f
-                    + 10.14333127 * rh
-                    - 0.22475541 * temp_f * rh
-                    - 6.83783e-3 * temp_f**2
-                    - 5.481717e-2 * rh**2
-                    + 1.22874e-3 * temp_f**2 * rh
-                    + 8.5282e-4 * temp_f * rh**2
-                    - 1.99e-6 * temp_f**2 * rh**2
-                )
+    def _add_derived_variables(
+        df: pd.DataFrame, wanted: Optional[Set[str]] = None
+    ) -> pd.DataFrame:
+        """Add derived weather variables.
 
-                # Convert back to Celsius
-                heat_index_c = (hi - 32) * 5 / 9
-                df_derived.loc[mask, "heat_index"] = heat_index_c[mask]
+        Args:
+            df: DataFrame with standardized columns and units
+            wanted: Derived variables to compute (None = all applicable)
 
+        Returns:
+            DataFrame with the derived columns added
+        """
+        df_derived = WeatherDataProcessor._working_copy(df)
+
+        columns = df_derived.columns
+        has_temp = "temperature" in columns
+        has_humidity = has_temp and "humidity" in columns
+        do_wind_chill = (
+            has_temp
+            and "wind_speed" in columns
+            and (wanted is None or "wind_chill" in wanted)
+        )
+        do_heat_index = has_humidity and (wanted is None or "heat_index" in wanted)
         # Dew point calculation (if not already provided)
-        if (
-            (
-                "dew_point" not in df_derived.columns
-                or df_derived["dew_point"].isna().all()
-            )
-            and "temperature" in df_derived.columns
-            and "humidity" in df_derived.columns
-        ):
-            temp = df_derived["temperature"]
-            rh = df_derived["humidity"]
-
-            # Magnus formula for dew point calculation
-            # Constants for Magnus formula
-            a = 17.27
-            b = 237.7
+        do_dew_point = (
+            has_humidity
+            and (wanted is None or "dew_point" in wanted)
+            and ("dew_point" not in columns or df_derived["dew_point"].isna().all())
+        )
 
-            # Calculate alpha
-            alpha = ((a * temp) / (b + temp)) + np.log(rh / 100.0)
+        if not (do_wind_chill or do_heat_index or do_dew_point):
+            return df_derived
 
-            # Calculate dew point
-            dew_point = (b * alpha) / (a - alpha)
+        n = len(df_derived)
+        temp = WeatherDataProcessor._float_array(df_derived["temperature"])
+        wind = (
+            WeatherDataProcessor._float_array(df_derived["wind_speed"])
+            if do_wind_chill
+            else temp
+        )
+        rh = (
+            WeatherDataProcessor._float_array(df_derived["humidity"])
+            if has_humidity
+            else temp
+        )
+        # Output buffers are only allocated for the variables being computed
+        wind_chill = _nan_buffer(n if do_wind_chill else 0)
+        heat_index = _nan_buffer(n if do_heat_index else 0)
+        dew_point = _nan_buffer(n if do_dew_point else 0)
+
+        # Wind chill, heat index and Magnus dew point in one fused pass
+        compute_derived(
+            temp,
+            wind,
+            rh,
+            wind_chill,
+            heat_index,
+            dew_point,
+            do_wind_chill,
+            do_heat_index,
+            do_dew_point,
+        )
 
+        # Only add wind chill / heat index where their formulas apply somewhere
+        if do_wind_chill and not np.isnan(wind_chill).all():
+            df_derived["wind_chill"] = wind_chill
+        if do_heat_index and not np.isnan(heat_index).all():
+            df_derived["heat_index"] = heat_index
+        if do_dew_point:
             df_derived["dew_point"] = dew_point
 
         return df_derived
@@ -410,10 +1049,26 @@ class WeatherDataProcessor:
 class DataClientRegistry:
     """Registry for managing multiple data clients."""
 
+    # Seconds a successful connection test is trusted
+    health_ttl = 5.0
+    # Bounds for the retry delay after failed connection tests (doubles per failure)
+    health_backoff_min = 5.0
+    health_backoff_max = 60.0
+    # Seconds to wait for parallel connection tests
+    probe_timeout = 5.0
+
     def __init__(self) -> None:
         """Initialize the registry."""
         self.clients: Dict[str, Dict[str, Any]] = {}
-        self.default_priority: List[str] = []
+        # Sorted (-priority, registration order, name) entries
+        self._priority_list: List[Tuple[int, int, str]] = []
+        # Client name -> (available, next probe time, current backoff)
+        self._health: Dict[str, Tuple[bool, float, float]] = {}
+
+    @property
+    def default_priority(self) -> List[str]:
+        """Client names ordered from highest to lowest priority."""
+        return [name for _, _, name in self._priority_list]
 
     def register_client(
         self, name: str, client: WeatherDataClient, priority: int = 0
@@ -425,16 +1080,23 @@ class DataClientRegistry:
             client: Client instance
             priority: Priority (higher = preferred)
         """
+        previous = self.clients.get(name)
+        if previous is not None:
+            order = previous["order"]
+            self._priority_list.remove((-previous["priority"], order, name))
+        else:
+            order = len(self.clients)
+
         self.clients[name] = {
             "client": client,
             "priority": priority,
+            "order": order,
             "info": client.get_source_info(),
         }
 
         # Update priority list
-        self.default_priority = sorted(
-            self.clients.keys(), key=lambda x: self.clients[x]["priority"], reverse=True
-        )
+        bisect.insort(self._priority_list, (-priority, order, name))
+        self._health.pop(name, None)
 
     def get_client(self, name: str) -> Optional[WeatherDataClient]:
         """Get a specific client by name.
@@ -458,18 +1120,72 @@ class DataClientRegistry:
         Returns:
             Best available client or None
         """
-        for client_name in self.default_priority:
-            client: WeatherDataClient = self.clients[client_name]["client"]
-
-            # Test if client is available
-            try:
-                if client.test_connection():
-                    return client
-            except (OSError, IOError, RuntimeError, ValueError):
-                continue
+        now = time.monotonic()
+        results: Dict[str, bool] = {}
+        stale: List[str] = []
+        for _, _, client_name in self._priority_list:
+            available, next_probe, _ = self._health.get(client_name, (False, 0.0, 0.0))
+            if now < next_probe:
+                results[client_name] = available
+            else:
+                stale.append(client_name)
+
+        # Probe all clients with expired health entries in parallel
+        results.update(self._probe_clients(stale))
+
+        for _, _, client_name in self._priority_list:
+            if results.get(client_name):
+                client: WeatherDataClient = self.clients[client_name]["client"]
+                return client
 
         return None
 
+    def _probe_clients(self, names: List[str]) -> Dict[str, bool]:
+        """Run connection tests concurrently and record the results.
+
+        Successful tests are cached for health_ttl seconds; failing clients are
+        re-probed with exponential backoff. Tests that do not finish within
+        probe_timeout seconds count as failures.
+
+        Args:
+            names: Client names to probe
+
+        Returns:
+            Mapping of client name to availability
+        """
+        if not names:
+            return {}
+
+        results = {name: False for name in names}
+        executor = ThreadPoolExecutor(max_workers=len(names))
+        try:
+            futures = {
+                executor.submit(self.clients[name]["client"].test_connection): name
+                for name in names
+            }
+            for future in as_completed(futures, timeout=self.probe_timeout):
+                try:
+                    results[futures[future]] = bool(future.result())
+                except (OSError, IOError, RuntimeError, ValueError):
+                    pass
+        except FuturesTimeoutError:
+            logger.warning("Connection tests timed out after %ss", self.probe_timeout)
+        finally:
+            executor.shutdown(wait=False)
+
+        now = time.monotonic()
+        for name, available in results.items():
+            if available:
+                self._health[name] = (True, now + self.health_ttl, 0.0)
+            else:
+                backoff = self._health.get(name, (False, 0.0, 0.0))[2]
+                backoff = min(
+                    self.health_backoff_max, max(self.health_backoff_min, backoff * 2)
+                )
+                self._health[name] = (False, now + backoff, backoff)
+
+        return results
+
     def list_clients(self) -> Dict[str, DataSourceInfo]:
         """List all registered clients.
 
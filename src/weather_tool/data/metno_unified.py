@@ -8,25 +8,95 @@ This module provides implementations for fetching weather data from Met.no servi
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import pyproj
 import requests
 import xarray as xr
 
 from .interfaces import (
+    _DERIVED_INPUTS,
+    _SESSION,
+    _SOURCE_TO_STD,
     DataSourceInfo,
     DataSourceType,
     FileWeatherClient,
     HTTPWeatherClient,
     WeatherDataClient,
     WeatherDataProcessor,
+    _naive_timestamp,
 )
 
 logger = logging.getLogger(__name__)
 
+# Flattened Met.no instant detail paths for each source column produced by the
+# parser (json_normalize joins nested keys with ".")
+_METNO_INSTANT_FIELDS: Tuple[Tuple[str, str], ...] = tuple(
+    (name, f"data.instant.details.{key}")
+    for name, key in (
+        ("air_temperature_2m", "air_temperature"),
+        ("air_pressure_at_sea_level", "air_pressure_at_sea_level"),
+        ("relative_humidity_2m", "relative_humidity"),
+        ("wind_speed_10m", "wind_speed"),
+        ("wind_from_direction_10m", "wind_from_direction"),
+        ("cloud_area_fraction", "cloud_area_fraction"),
+        ("high_type_cloud_area_fraction", "cloud_area_fraction_high"),
+        ("medium_type_cloud_area_fraction", "cloud_area_fraction_medium"),
+        ("low_type_cloud_area_fraction", "cloud_area_fraction_low"),
+        ("dew_point_temperature_2m", "dew_point_temperature"),
+        ("fog_area_fraction", "fog_area_fraction"),
+    )
+)
+
+# (column prefix, precipitation path, symbol path) for each forecast period,
+# in order of preference
+_METNO_PERIOD_FIELDS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (
+        f"data.{period}.",
+        f"data.{period}.details.precipitation_amount",
+        f"data.{period}.summary.symbol_code",
+    )
+    for period in ("next_1_hours", "next_6_hours")
+)
+
+# Timestamp format used by the locationforecast API ("2024-01-15T12:00:00Z")
+_METNO_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _parse_metno_times(times: pd.Series) -> pd.Series:
+    """Parse Met.no ISO-8601 timestamps to timezone-naive UTC.
+
+    The explicit API format skips per-value format inference; other ISO-8601
+    variants (e.g. numeric UTC offsets) fall back to general parsing. The
+    whole column is converted to UTC and has its timezone dropped at once.
+    """
+    try:
+        parsed = pd.to_datetime(times, utc=True, format=_METNO_TIME_FORMAT)
+    except ValueError:
+        parsed = pd.to_datetime(times, utc=True)
+    return parsed.dt.tz_convert(None)
+
+
+@lru_cache(maxsize=1)
+def _meps_transformer() -> pyproj.Transformer:
+    """Get the WGS84 to MEPS grid transformer, built once per process."""
+    # Default Lambert Conformal Conic for MEPS
+    crs = pyproj.CRS.from_cf(
+        {
+            "grid_mapping_name": "lambert_conformal_conic",
+            "standard_parallel": [63.3, 63.3],
+            "longitude_of_central_meridian": 15.0,
+            "latitude_of_projection_origin": 63.3,
+            "earth_radius": 6371000.0,
+        }
+    )
+    return pyproj.Transformer.from_crs(4326, crs, always_xy=True)
+
 
 class MetNoHTTPClient(HTTPWeatherClient):
     """Met.no HTTP API client for real-time weather data."""
@@ -39,11 +109,14 @@ class MetNoHTTPClient(HTTPWeatherClient):
         )
         self.user_agent = getattr(config.api, "user_agent", "weather-tool/1.0")
 
-        # Update session headers for Met.no API requirements
-        self.session.headers.update(
+        # Update request headers for Met.no API requirements
+        self._headers.update(
             {
                 "User-Agent": self.user_agent,
                 "Accept": "application/json",
+                # Forecast JSON is verbose; ask for a compressed response on
+                # both the requests and aiohttp paths
+                "Accept-Encoding": "gzip, deflate",
             }
         )
 
@@ -63,35 +136,19 @@ class MetNoHTTPClient(HTTPWeatherClient):
             raise ValueError(f"Invalid time range: {start_time} to {end_time}")
 
         try:
-            # Met.no locationforecast API endpoint - use complete to get all cloud layers and dew point
-            url = f"{self.base_url}/complete"
-            params = {
-                "lat": latitude,
-                "lon": longitude,
-            }
+            url, params = self._build_request(latitude, longitude)
 
             logger.info(
                 "Fetching weather data from Met.no API for %f, %f", latitude, longitude
             )
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(
+                url, params=params, headers=self._headers, timeout=30
+            )
             response.raise_for_status()
 
-            data = response.json()
-
-            # Convert Met.no JSON to DataFrame
-            df = self._parse_metno_json(data, start_time, end_time)
+            data = self._loads(response.content)
 
-            # Standardize the DataFrame
-            source_info = self.get_source_info()
-            standardized_df = WeatherDataProcessor.standardize_dataframe(
-                df, source_info
-            )
-
-            logger.info(
-                "Successfully fetched %d data points from Met.no API",
-                len(standardized_df),
-            )
-            return standardized_df
+            return self._process_response(data, start_time, end_time, variables)
 
         except requests.RequestException as e:
             logger.error("Failed to fetch data from Met.no API: %s", e)
@@ -100,6 +157,71 @@ class MetNoHTTPClient(HTTPWeatherClient):
             logger.error("Error processing Met.no API data: %s", e)
             raise
 
+    async def aget_weather_data(
+        self,
+        latitude: float,
+        longitude: float,
+        start_time: datetime,
+        end_time: datetime,
+        variables: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Fetch weather data from Met.no locationforecast API using aiohttp."""
+        if not self.validate_coordinates(latitude, longitude):
+            raise ValueError(f"Invalid coordinates: {latitude}, {longitude}")
+
+        if not self.validate_time_range(start_time, end_time):
+            raise ValueError(f"Invalid time range: {start_time} to {end_time}")
+
+        url, params = self._build_request(latitude, longitude)
+
+        logger.info(
+            "Fetching weather data from Met.no API (async) for %f, %f",
+            latitude,
+            longitude,
+        )
+        data = await self._aget_json(url, params)
+
+        try:
+            return self._process_response(data, start_time, end_time, variables)
+        except (ValueError, TypeError, KeyError, RuntimeError) as e:
+            logger.error("Error processing Met.no API data: %s", e)
+            raise
+
+    def _build_request(
+        self, latitude: float, longitude: float
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the locationforecast URL and query parameters."""
+        # Met.no locationforecast API endpoint - use complete to get all cloud layers and dew point
+        url = f"{self.base_url}/complete"
+        params = {
+            "lat": latitude,
+            "lon": longitude,
+        }
+        return url, params
+
+    def _process_response(
+        self,
+        data: Dict[str, Any],
+        start_time: datetime,
+        end_time: datetime,
+        variables: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Convert a decoded Met.no response to a standardized DataFrame."""
+        # Convert Met.no JSON to DataFrame
+        df = self._parse_metno_json(data, start_time, end_time)
+
+        # Standardize the DataFrame
+        source_info = self.get_source_info()
+        standardized_df = WeatherDataProcessor.standardize_dataframe(
+            df, source_info, set(variables) if variables else None
+        )
+
+        logger.info(
+            "Successfully fetched %d data points from Met.no API",
+            len(standardized_df),
+        )
+        return standardized_df
+
     def _parse_metno_json(
         self, data: Dict[str, Any], start_time: datetime, end_time: datetime
     ) -> pd.DataFrame:
@@ -109,85 +231,74 @@ class MetNoHTTPClient(HTTPWeatherClient):
         if not timeseries:
             raise ValueError("No timeseries data found in Met.no response")
 
-        records = []
-        for entry in timeseries:
-            time_str = entry.get("time")
-            if not time_str:
-                continue
-
-            # Parse timestamp and make timezone-naive for comparison
-            timestamp = pd.to_datetime(time_str)
-            if timestamp.tz is not None:
-                timestamp = timestamp.tz_convert("UTC").tz_localize(None)
-
-            # Ensure start_time and end_time are timezone-naive
-            start_naive = (
-                start_time.replace(tzinfo=None) if start_time.tzinfo else start_time
-            )
-            end_naive = end_time.replace(tzinfo=None) if end_time.tzinfo else end_time
-
-            # Filter by time range
-            if timestamp < start_naive or timestamp > end_naive:
-                continue
-
-            # Extract weather data
-            instant_data = entry.get("data", {}).get("instant", {}).get("details", {})
-            next_1h_data = entry.get("data", {}).get("next_1_hours", {})
-            next_6h_data = entry.get("data", {}).get("next_6_hours", {})
-
-            record = {
-                "timestamp": timestamp,
-                "air_temperature_2m": instant_data.get("air_temperature"),
-                "air_pressure_at_sea_level": instant_data.get(
-                    "air_pressure_at_sea_level"
-                ),
-                "relative_humidity_2m": instant_data.get("relative_humidity"),
-                "wind_speed_10m": instant_data.get("wind_speed"),
-                "wind_from_direction_10m": instant_data.get("wind_from_direction"),
-                "cloud_area_fraction": instant_data.get("cloud_area_fraction"),
-                "high_type_cloud_area_fraction": instant_data.get(
-                    "cloud_area_fraction_high"
-                ),
-                "medium_type_cloud_area_fraction": instant_data.get(
-                    "cloud_area_fraction_medium"
-                ),
-                "low_type_cloud_area_fraction": instant_data.get(
-                    "cloud_area_fraction_low"
-                ),
-                "dew_point_temperature_2m": instant_data.get("dew_point_temperature"),
-                "fog_area_fraction": instant_data.get("fog_area_fraction"),
-            }
+        # Flatten all entries in one call; nested keys become dotted columns
+        flat = pd.json_normalize(timeseries, sep=".")
+        if "time" not in flat.columns:
+            raise ValueError("No data points found in specified time range")
 
-            # Add precipitation from next_1_hours or next_6_hours
-            if next_1h_data:
-                details = next_1h_data.get("details", {})
-                record["precipitation_amount"] = details.get("precipitation_amount", 0)
-
-                # Weather symbol
-                summary = next_1h_data.get("summary", {})
-                record["symbol_code"] = summary.get("symbol_code")
-            elif next_6h_data:
-                details = next_6h_data.get("details", {})
-                record["precipitation_amount"] = details.get("precipitation_amount", 0)
-
-                # Weather symbol
-                summary = next_6h_data.get("summary", {})
-                record["symbol_code"] = summary.get("symbol_code")
-            else:
-                record["precipitation_amount"] = 0
-                record["symbol_code"] = None
+        # Parse timestamps in one pass as timezone-naive UTC
+        timestamps = _parse_metno_times(flat["time"])
 
-            records.append(record)
+        # Compare against the window bounds in the same naive UTC frame
+        start_naive = _naive_timestamp(start_time)
+        end_naive = _naive_timestamp(end_time)
 
-        if not records:
+        # Filter by time range (entries without a time are NaT and dropped)
+        mask = ((timestamps >= start_naive) & (timestamps <= end_naive)).to_numpy()
+        if not mask.any():
             raise ValueError("No data points found in specified time range")
+        flat = flat.loc[mask]
+        n = len(flat)
+
+        # Build plain float32 column arrays; fields missing from every entry
+        # become all-NaN columns
+        columns: Dict[str, np.ndarray] = {}
+        for name, path in _METNO_INSTANT_FIELDS:
+            columns[name] = (
+                flat[path].to_numpy(dtype=np.float32, na_value=np.nan)
+                if path in flat.columns
+                else np.full(n, np.nan, dtype=np.float32)
+            )
 
-        df = pd.DataFrame(records)
-        df.set_index("timestamp", inplace=True)
-        df.sort_index(inplace=True)
-
+        # Precipitation and weather symbol from next_1_hours, else next_6_hours
+        precipitation = np.zeros(n, dtype=np.float32)
+        symbol = np.full(n, None, dtype=object)
+        taken = np.zeros(n, dtype=bool)
+        for prefix, precip_path, symbol_path in _METNO_PERIOD_FIELDS:
+            selected = ~taken & self._has_period(flat, prefix)
+            taken |= selected
+            if precip_path in flat.columns:
+                amounts = flat[precip_path].to_numpy(dtype=np.float32, na_value=0)
+                precipitation[selected] = amounts[selected]
+            if symbol_path in flat.columns:
+                codes = flat[symbol_path].to_numpy(dtype=object)
+                take = selected & pd.notna(codes)
+                symbol[take] = codes[take]
+        columns["precipitation_amount"] = precipitation
+        columns["symbol_code"] = symbol
+
+        index = pd.DatetimeIndex(timestamps.to_numpy()[mask], name="timestamp")
+
+        # Met.no returns entries in time order; only reorder when it doesn't
+        if not index.is_monotonic_increasing:
+            order = index.argsort(kind="stable")
+            index = index[order]
+            columns = {name: values[order] for name, values in columns.items()}
+
+        df = pd.DataFrame(columns, index=index)
+        # A forecast repeats a handful of symbol codes; store each string once
+        df["symbol_code"] = df["symbol_code"].astype("category")
         return df
 
+    @staticmethod
+    def _has_period(flat: pd.DataFrame, prefix: str) -> np.ndarray:
+        """Flag entries that contain a non-empty forecast period block."""
+        period_columns = [col for col in flat.columns if col.startswith(prefix)]
+        if not period_columns:
+            return np.zeros(len(flat), dtype=bool)
+        has_period: np.ndarray = flat[period_columns].notna().to_numpy().any(axis=1)
+        return has_period
+
     def test_connection(self) -> bool:
         """Test connection to Met.no API."""
         try:
@@ -195,7 +306,9 @@ class MetNoHTTPClient(HTTPWeatherClient):
             url = f"{self.base_url}/compact"
             params = {"lat": 59.9139, "lon": 10.7522}
 
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(
+                url, params=params, headers=self._headers, timeout=10
+            )
             return response.status_code == 200
         except (requests.RequestException, ValueError, TypeError):
             return False
@@ -231,6 +344,9 @@ class MetNoHTTPClient(HTTPWeatherClient):
 class MetNoFileClient(FileWeatherClient):
     """Met.no THREDDS file server client for archive data."""
 
+    # Maximum number of open THREDDS datasets kept per client
+    dataset_cache_size = 8
+
     def __init__(self, config: Any):
         """Initialize Met.no file client."""
         super().__init__(config)
@@ -260,8 +376,20 @@ class MetNoFileClient(FileWeatherClient):
 
             logger.info("Opening THREDDS file: %s", file_url)
 
-            # Open dataset
-            ds = xr.open_dataset(file_url, decode_times=True)
+            # Open dataset (reused across calls for the same file)
+            ds = self._open_dataset(file_url)
+
+            # Only transfer variables that standardization can map (and that
+            # the caller asked for, directly or as input to a derived one)
+            needed = self._needed_variables(variables)
+            mapped = [
+                name
+                for name in ds.data_vars
+                if name in _SOURCE_TO_STD
+                and (needed is None or _SOURCE_TO_STD[name][0] in needed)
+            ]
+            if mapped:
+                ds = ds[mapped]
 
             # Convert coordinates to projection
             x, y = self._convert_coordinates(latitude, longitude, ds)
@@ -281,7 +409,7 @@ class MetNoFileClient(FileWeatherClient):
             # Standardize the DataFrame
             source_info = self.get_source_info()
             standardized_df = WeatherDataProcessor.standardize_dataframe(
-                df, source_info
+                df, source_info, set(variables) if variables else None
             )
 
             logger.info(
@@ -293,6 +421,43 @@ class MetNoFileClient(FileWeatherClient):
             logger.error("Failed to fetch data from THREDDS: %s", e)
             raise
 
+    @staticmethod
+    def _needed_variables(variables: Optional[List[str]]) -> Optional[Set[str]]:
+        """Get the standardized variables to load for a request.
+
+        Args:
+            variables: Requested standardized variables (None = all)
+
+        Returns:
+            Requested variables plus the inputs of requested derived variables,
+            or None to load everything
+        """
+        if not variables:
+            return None
+        needed = set(variables)
+        for name in variables:
+            needed.update(_DERIVED_INPUTS.get(name, ()))
+        return needed
+
+    def _open_dataset(self, file_url: str) -> xr.Dataset:
+        """Open a THREDDS dataset lazily, reusing the handle for repeat calls.
+
+        Only metadata is read on open; data is fetched when the selected point
+        is converted to a DataFrame. Handles are kept in least-recently-used
+        order and the oldest is closed once more than dataset_cache_size are
+        open.
+        """
+        ds: Optional[xr.Dataset] = self._file_cache.pop(file_url, None)
+        if ds is None:
+            ds = xr.open_dataset(file_url, decode_times=True)
+        self._file_cache[file_url] = ds
+
+        while len(self._file_cache) > self.dataset_cache_size:
+            oldest = next(iter(self._file_cache))
+            self._file_cache.pop(oldest).close()
+
+        return ds
+
     def _get_file_url(self, target_time: datetime) -> str:
         """Get THREDDS file URL for the target time."""
         # Use a recent file for demonstration
@@ -308,24 +473,28 @@ class MetNoFileClient(FileWeatherClient):
         return url
 
     def _convert_coordinates(
-        self, latitude: float, longitude: float, ds: xr.Dataset
+        self,
+        latitude: Union[float, np.ndarray],
+        longitude: Union[float, np.ndarray],
+        ds: xr.Dataset,
     ) -> tuple:
-        """Convert lat/lon to dataset projection coordinates."""
+        """Convert lat/lon to dataset projection coordinates.
+
+        Args:
+            latitude: Latitude in degrees, a scalar or an array of points
+            longitude: Longitude in degrees, same shape as latitude
+            ds: Dataset the coordinates are converted for
+
+        Returns:
+            Tuple of (x, y) projection coordinates; arrays for array input
+        """
         try:
-            # Default Lambert Conformal Conic for MEPS
-            crs = pyproj.CRS.from_cf(
-                {
-                    "grid_mapping_name": "lambert_conformal_conic",
-                    "standard_parallel": [63.3, 63.3],
-                    "longitude_of_central_meridian": 15.0,
-                    "latitude_of_projection_origin": 63.3,
-                    "earth_radius": 6371000.0,
-                }
+            # Arrays are transformed in a single call rather than per point
+            x, y = _meps_transformer().transform(
+                np.asarray(longitude), np.asarray(latitude)
             )
-
-            # Transform coordinates
-            proj = pyproj.Proj.from_crs(4326, crs, always_xy=True)
-            x, y = proj.transform(longitude, latitude)
+            if np.ndim(latitude) == 0:
+                return float(x), float(y)
 
             return x, y
 
@@ -343,20 +512,44 @@ class MetNoFileClient(FileWeatherClient):
                 [col[0] if col[1] == "" else f"{col[0]}_{col[1]}" for col in df.columns]
             )
 
-        # Reset index to make time a column, then set it back
-        df = df.reset_index()
-        if "time" in df.columns:
-            df.set_index("time", inplace=True)
+        # Keep time as the only index level; other dimensions become columns
+        index_names = list(df.index.names)
+        if index_names == ["time"]:
+            return df
+        if "time" in index_names:
+            df = df.reset_index(level=[name for name in index_names if name != "time"])
+        else:
+            df = df.reset_index()
+            if "time" in df.columns:
+                df.set_index("time", inplace=True)
 
         return df
 
-    def test_connection(self) -> bool:
-        """Test connection to THREDDS server."""
-        try:
-            # Test with a recent file
-            test_date = datetime.now() - timedelta(days=1)
-            test_url = self._get_file_url(test_date)
+    def test_connection(self, deep: bool = False) -> bool:
+        """Test connection to THREDDS server.
 
+        Args:
+            deep: Open the dataset instead of only checking that it is served
+
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        # Test with a recent file
+        test_date = datetime.now() - timedelta(days=1)
+        test_url = self._get_file_url(test_date)
+
+        if not deep:
+            # HEAD on the (small) OPeNDAP structure response instead of
+            # downloading all dataset metadata
+            try:
+                response = _SESSION.head(
+                    f"{test_url}.dds", timeout=5, allow_redirects=True
+                )
+                return response.status_code < 400
+            except requests.RequestException:
+                return False
+
+        try:
             # Try to open the dataset
             ds = xr.open_dataset(test_url)
             ds.close()
@@ -416,7 +609,15 @@ class MetNoUnifiedClient(WeatherDataClient):
 
         # For recent/future data, prefer HTTP API
         now = datetime.now()
-        if start_time > now - timedelta(days=2):
+        boundary = now - timedelta(days=2)
+        # A window spanning the archive boundary needs both sources
+        split_df = self._try_split_weather_data(
+            latitude, longitude, start_time, end_time, boundary, variables
+        )
+        if split_df is not None:
+            return split_df
+
+        if start_time > boundary:
             try:
                 logger.info("Trying Met.no HTTP API for recent/forecast data")
                 return self.http_client.get_weather_data(
@@ -441,7 +642,7 @@ class MetNoUnifiedClient(WeatherDataClient):
             logger.warning("THREDDS failed: %s", e)
 
             # If THREDDS fails and we haven't tried HTTP yet, try it
-            if start_time <= now - timedelta(days=2):
+            if start_time <= boundary:
                 try:
                     logger.info("Fallback to HTTP API")
                     return self.http_client.get_weather_data(
@@ -461,10 +662,109 @@ class MetNoUnifiedClient(WeatherDataClient):
             else:
                 raise
 
+    def _try_split_weather_data(
+        self,
+        latitude: float,
+        longitude: float,
+        start_time: datetime,
+        end_time: datetime,
+        boundary: datetime,
+        variables: Optional[List[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Fetch a window spanning the archive boundary from both sources.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            start_time: Start of the requested window
+            end_time: End of the requested window
+            boundary: Time separating archive and recent data
+            variables: Requested standardized variables (None = all)
+
+        Returns:
+            Combined DataFrame, or None if the window does not span the
+            boundary or either source failed
+        """
+        if not start_time < boundary < end_time:
+            return None
+
+        try:
+            return self._get_split_weather_data(
+                latitude, longitude, start_time, end_time, boundary, variables
+            )
+        except (
+            requests.RequestException,
+            OSError,
+            IOError,
+            ValueError,
+            TypeError,
+            KeyError,
+            RuntimeError,
+        ) as e:
+            logger.warning("Split fetch failed: %s, trying single sources", e)
+            return None
+
+    def _get_split_weather_data(
+        self,
+        latitude: float,
+        longitude: float,
+        start_time: datetime,
+        end_time: datetime,
+        boundary: datetime,
+        variables: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Fetch a window spanning the archive boundary from both sources.
+
+        The archive part (up to boundary) comes from THREDDS and the recent
+        part from the HTTP API. Both requests run concurrently, so the call
+        takes as long as the slower source rather than their sum.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            start_time: Start of the requested window
+            end_time: End of the requested window
+            boundary: Time separating archive and recent data
+            variables: Requested standardized variables (None = all)
+
+        Returns:
+            Combined DataFrame sorted by time, recent values winning on overlap
+        """
+        logger.info("Fetching THREDDS and HTTP API data concurrently")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            file_future = executor.submit(
+                self.file_client.get_weather_data,
+                latitude,
+                longitude,
+                start_time,
+                boundary,
+                variables,
+            )
+            http_future = executor.submit(
+                self.http_client.get_weather_data,
+                latitude,
+                longitude,
+                boundary,
+                end_time,
+                variables,
+            )
+            archive_df = file_future.result()
+            recent_df = http_future.result()
+
+        combined = pd.concat([archive_df, recent_df]).sort_index(kind="stable")
+        deduplicated: pd.DataFrame = combined.loc[
+            ~combined.index.duplicated(keep="last")
+        ]
+        return deduplicated
+
     def test_connection(self) -> bool:
         """Test connection to both HTTP and THREDDS."""
-        http_ok = self.http_client.test_connection()
-        file_ok = self.file_client.test_connection()
+        # Run both probes concurrently so the check takes as long as the slower one
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            http_future = executor.submit(self.http_client.test_connection)
+            file_future = executor.submit(self.file_client.test_connection)
+            http_ok = http_future.result()
+            file_ok = file_future.result()
 
         logger.info("Connection test: HTTP=%s, THREDDS=%s", http_ok, file_ok)
         return http_ok or file_ok
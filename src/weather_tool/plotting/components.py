@@ -5,18 +5,218 @@ This module provides the essential components needed for the meteogram plotter.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import math
+import weakref
+from functools import lru_cache, partial
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union, cast
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib import cbook, rcParams
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
-from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
+from matplotlib.figure import Figure, SubFigure
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import Rectangle
 
 from .interfaces import PlotConfig
 
 logger = logging.getLogger(__name__)
 
+# Cloud layer colors used when variable_config has no entry (settings.yaml values)
+_DEFAULT_CLOUD_COLORS: Dict[str, Dict[str, Any]] = {
+    "cloud_high": {
+        "color": "#87CEEB",
+        "alpha": 1.0,
+        "edge_color": "#5F9EA0",
+        "edge_width": 0.5,
+    },
+    "cloud_medium": {
+        "color": "#4682B4",
+        "alpha": 1.0,
+        "edge_color": "#2F4F4F",
+        "edge_width": 0.5,
+    },
+    "cloud_low": {
+        "color": "#2F4F4F",
+        "alpha": 1.0,
+        "edge_color": "#1C1C1C",
+        "edge_width": 0.5,
+    },
+    "fog": {
+        "color": "#48CAE4",
+        "alpha": 1.0,
+        "edge_color": "#0077BE",
+        "edge_width": 0.5,
+    },
+}
+
+# Bottom legend entries in display order:
+# (column, color key, default color, label, symbol type). Temperature has two
+# entries for the above/below freezing colors.
+_LEGEND_SPEC: Tuple[Tuple[str, str, str, str, str], ...] = (
+    ("temperature", "temperature_above", "#d62728", "Temperature ≥0°C", "line"),
+    ("temperature", "temperature_below", "#1f77b4", "Temperature <0°C", "line"),
+    ("dew_point", "dew_point", "#17becf", "Dew Point", "dashed_line"),
+    ("wind_speed", "wind", "#ff7f0e", "Wind Speed", "line"),
+    ("pressure", "pressure", "#2ca02c", "Pressure", "line"),
+    ("precipitation", "precipitation", "#1f77b4", "Precipitation", "bar"),
+)
+# Cloud layer legend entries, shown after the others: (column, label). Their
+# colors come from the variable config rather than the color scheme.
+_CLOUD_LEGEND_SPEC: Tuple[Tuple[str, str], ...] = (
+    ("cloud_high", "High Clouds"),
+    ("cloud_medium", "Medium Clouds"),
+    ("cloud_low", "Low Clouds"),
+    ("fog", "Fog"),
+)
+_LEGEND_COLUMNS: FrozenSet[str] = frozenset(
+    [spec[0] for spec in _LEGEND_SPEC] + [spec[0] for spec in _CLOUD_LEGEND_SPEC]
+)
+
+
+def _add_vertical_lines(
+    ax: Axes,
+    positions: np.ndarray,
+    color: str,
+    alpha: float,
+    linewidths: Any,
+) -> None:
+    """Draw full-height vertical lines at data x positions as one collection.
+
+    Equivalent to one ``axvline`` per position, but builds a single artist.
+    """
+    if len(positions) == 0:
+        return
+
+    xs = np.asarray(positions, dtype=float)
+    segments = np.empty((xs.size, 2, 2))
+    segments[:, :, 0] = xs[:, None]
+    segments[:, 0, 1] = 0.0
+    segments[:, 1, 1] = 1.0
+
+    ax.add_collection(
+        LineCollection(
+            # An (N, 2, 2) array is accepted as a sequence of segments
+            cast(Sequence[np.ndarray], segments),
+            colors=color,
+            alpha=alpha,
+            linewidths=linewidths,
+            linestyles="solid",
+            transform=ax.get_xaxis_transform(),
+        ),
+        autolim=False,
+    )
+
+
+@lru_cache(maxsize=128)
+def _nice_grid_values(
+    y_axis_minimum: float, y_axis_maximum: float, maximum_grid_lines: int
+) -> Tuple[float, ...]:
+    """Compute nice round grid values (cached; axis limits repeat across renders)."""
+    # Calculate the range
+    y_axis_value_range = y_axis_maximum - y_axis_minimum
+    if y_axis_value_range == 0:
+        return ()
+
+    # Calculate a nice step size
+    approximate_step_size = y_axis_value_range / maximum_grid_lines
+
+    # Find the order of magnitude
+    step_magnitude = math.floor(math.log10(approximate_step_size))
+
+    # Normalize the rough step to between 1 and 10
+    normalized_step_size = approximate_step_size / (10**step_magnitude)
+
+    # Choose a nice step size
+    if normalized_step_size <= 1:
+        rounded_step_size = 1
+    elif normalized_step_size <= 2:
+        rounded_step_size = 2
+    elif normalized_step_size <= 5:
+        rounded_step_size = 5
+    else:
+        rounded_step_size = 10
+
+    # Scale back up
+    final_step_size = rounded_step_size * (10**step_magnitude)
+
+    # Find the starting point (round down to nearest step)
+    grid_start_value = math.floor(y_axis_minimum / final_step_size) * final_step_size
+
+    # Generate all steps up to the maximum at once, keeping those within range
+    step_count = math.floor((y_axis_maximum - grid_start_value) / final_step_size) + 2
+    candidates = grid_start_value + final_step_size * np.arange(step_count)
+    in_range = (candidates >= y_axis_minimum) & (candidates <= y_axis_maximum)
+    return tuple(candidates[in_range].tolist())
+
+
+@lru_cache(maxsize=16)
+def _padded_xlim(
+    data_length: int,
+    step_hours: Optional[float],
+    start_padding: float,
+    end_padding: float,
+    start_padding_hours: Optional[float],
+    end_padding_hours: Optional[float],
+) -> Tuple[float, float]:
+    """Compute padded x-axis limits (cached; every panel asks for the same)."""
+    # Calculate padding in data points
+    if start_padding_hours is not None and step_hours is not None:
+        # Convert hours to data points based on time resolution
+        start_padding_points = start_padding_hours / step_hours
+    else:
+        # Use fractional padding
+        start_padding_points = start_padding * (data_length - 1)
+
+    if end_padding_hours is not None and step_hours is not None:
+        # Convert hours to data points based on time resolution
+        end_padding_points = end_padding_hours / step_hours
+    else:
+        # Use fractional padding
+        end_padding_points = end_padding * (data_length - 1)
+
+    # Calculate limits
+    return (-start_padding_points, (data_length - 1) + end_padding_points)
+
+
+@lru_cache(maxsize=16)
+def _cached_font_properties(
+    size: Any,
+    weight: Any,
+    family: Tuple[str, ...],
+    style: Any,
+    variant: Any,
+    stretch: Any,
+) -> FontProperties:
+    """Build a FontProperties once per distinct font setting."""
+    return FontProperties(
+        family=list(family),
+        style=style,
+        variant=variant,
+        weight=weight,
+        stretch=stretch,
+        size=size,
+    )
+
+
+def _font_properties(size: Any, weight: Any) -> FontProperties:
+    """Get shared font properties for the current rcParams font settings.
+
+    Text artists copy the properties they are given, so one instance can be
+    passed to any number of them.
+    """
+    return _cached_font_properties(
+        size,
+        weight,
+        tuple(rcParams["font.family"]),
+        rcParams["font.style"],
+        rcParams["font.variant"],
+        rcParams["font.stretch"],
+    )
+
 
 class WindBarbPlotter:
     """Specialized plotter for wind barbs."""
@@ -49,27 +249,33 @@ class WindBarbPlotter:
 
         # Sample data to avoid overcrowding, but maintain time synchronization
         n_points = len(data)
-        if n_points > max_barbs:
-            step = max(1, n_points // max_barbs)
-            # Get the indices of sampled data to maintain time alignment
-            sampled_indices = list(range(0, n_points, step))
-            sampled_data = data.iloc[sampled_indices]
-        else:
-            sampled_indices = list(range(n_points))
-            sampled_data = data
+        step = max(1, n_points // max_barbs) if n_points > max_barbs else 1
+        # Positions of sampled data, which keep the barbs aligned in time
+        sampled_indices = np.arange(0, n_points, step, dtype=np.int64)
 
         # Convert wind direction from degrees to u,v components
-        wind_speed = sampled_data["wind_speed"].fillna(0)
-        wind_direction = sampled_data["wind_direction"].fillna(0)
+        wind_speed = np.nan_to_num(
+            data["wind_speed"].to_numpy(dtype=np.float32, na_value=np.nan)[
+                sampled_indices
+            ]
+        )
+        wind_direction = np.nan_to_num(
+            data["wind_direction"].to_numpy(dtype=np.float32, na_value=np.nan)[
+                sampled_indices
+            ]
+        )
 
-        # Convert to radians and calculate u,v components
-        wind_dir_rad = np.deg2rad(wind_direction)
-        u = -wind_speed * np.sin(wind_dir_rad)  # Negative for meteorological convention
-        v = -wind_speed * np.cos(wind_dir_rad)  # Negative for meteorological convention
+        # Convert to radians in place and calculate u,v components; the unit
+        # phasor yields cos (real) and sin (imag) from a single pass
+        wind_dir_rad = np.deg2rad(wind_direction, out=wind_direction)
+        phasor = np.exp(1j * wind_dir_rad)
+        np.negative(wind_speed, out=wind_speed)  # Meteorological convention
+        u = wind_speed * phasor.imag
+        v = wind_speed * phasor.real
 
-        # Create x positions for barbs - use original data indices to maintain time alignment
-        x_positions = np.array(sampled_indices)
-        y_positions = np.ones(len(sampled_data)) * 0.5  # Center vertically
+        # Barbs sit at the sampled data indices, centered vertically
+        x_positions = sampled_indices
+        y_positions = np.full(sampled_indices.size, 0.5)
 
         # Plot wind barbs
         ax.barbs(
@@ -93,9 +299,8 @@ class WindBarbPlotter:
         ax.set_xticklabels([])
         ax.tick_params(axis="both", direction="in", length=3)
 
-        # Remove all spines (boxes) around the wind barb area
-        for spine in ax.spines.values():
-            spine.set_visible(False)
+        # Remove all spines (boxes) around the wind barb area in one call
+        ax.spines[:].set_visible(False)
 
 
 class LayoutManager:
@@ -104,6 +309,30 @@ class LayoutManager:
     def __init__(self, config: PlotConfig):
         """Initialize layout manager."""
         self.config = config
+        # Released figures, cleared and reused by the next layout
+        self._figure_pool: List[Figure] = []
+
+    def release(self, fig: Figure) -> None:
+        """Return a figure that is no longer needed for reuse by later layouts.
+
+        The caller must not use the figure afterwards; its contents are
+        cleared when it is handed out again.
+
+        Args:
+            fig: Figure previously created by create_meteogram_layout
+        """
+        self._figure_pool.append(fig)
+
+    def _acquire_figure(self, figsize: Tuple[int, int]) -> Figure:
+        """Get a cleared pooled figure, or create one if the pool is empty."""
+        if not self._figure_pool:
+            return plt.figure(figsize=figsize, dpi=self.config.dpi)
+
+        fig = self._figure_pool.pop()
+        fig.clear()
+        fig.set_size_inches(*figsize)
+        fig.set_dpi(self.config.dpi)
+        return fig
 
     def create_meteogram_layout(
         self,
@@ -123,8 +352,8 @@ class LayoutManager:
         Returns:
             Tuple of (Figure, List of Axes objects)
         """
-        # Create figure
-        fig = plt.figure(figsize=figsize, dpi=self.config.dpi)
+        # Create figure (reusing a released one when available)
+        fig = self._acquire_figure(figsize)
 
         # Handle both dict and list inputs for panel_heights
         if isinstance(panel_heights, dict):
@@ -188,9 +417,12 @@ class CloudLayerPlotter:
     def __init__(self, config: PlotConfig):
         """Initialize cloud layer plotter."""
         self.config = config
-        self.axis_positions: Dict[str, Axes] = (
-            {}
-        )  # Store axis positions for legend placement
+        # Axis and layer colors per label, for legend placement
+        self.axis_positions: Dict[str, Tuple[Axes, dict]] = {}
+        # Resolved colors per variable, valid for the variable_config they
+        # were resolved from; holding that dict keeps the identity check safe
+        self._cloud_colors_source: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cloud_colors_cache: Dict[str, dict] = {}
 
     def plot_cloud_layers(
         self,
@@ -211,26 +443,75 @@ class CloudLayerPlotter:
             grid_interval: Grid interval for time axis
             label_padding: LabelPaddingConfig for custom label positioning
         """
-        # Store axis positions for legend placement
-        for ax, label in zip(axes, labels):
-            self.axis_positions[label] = ax
+        # Store axis positions and layer colors for legend placement
+        for ax, variable, label in zip(axes, variables, labels):
+            self.axis_positions[label] = (ax, self._get_cloud_colors(variable))
+
+        # Convert every available cloud column in one pass
+        coverage = self._normalize_cloud_coverage(
+            data, [variable for variable in variables if variable in data.columns]
+        )
+
+        # Get padding configuration from config
+        padding_config = self.config.get_effective_time_axis_padding()
 
         # Plot each cloud layer without individual legends
-        for ax, variable, label in zip(axes, variables, labels):
-            # Get padding configuration from config
-            padding_config = self.config.get_effective_time_axis_padding()
+        for ax, variable in zip(axes, variables):
             self._plot_single_layer_no_legend(
-                ax, data, variable, grid_interval, padding_config
+                ax,
+                data,
+                variable,
+                coverage.get(variable),
+                grid_interval,
+                padding_config,
             )
 
         # Then add all legends after plotting is complete
         self._add_all_legends(labels, label_padding)
 
+    @staticmethod
+    def _normalize_cloud_coverage(
+        data: pd.DataFrame, variables: List[str]
+    ) -> Dict[str, np.ndarray]:
+        """Convert cloud columns to 0-1 coverage arrays.
+
+        Non-numeric values and NaN count as no coverage. Columns whose values
+        are all within 0-1 are treated as fractions, others as percentages;
+        the result is clipped to the valid range.
+
+        Args:
+            data: DataFrame with cloud data
+            variables: Cloud columns present in data
+
+        Returns:
+            Dictionary mapping each variable to its normalized coverage
+        """
+        if not variables:
+            return {}
+
+        cloud_frame = data[variables]
+        if not all(pd.api.types.is_numeric_dtype(dt) for dt in cloud_frame.dtypes):
+            cloud_frame = cloud_frame.apply(pd.to_numeric, errors="coerce")
+
+        coverage = np.nan_to_num(
+            cloud_frame.to_numpy(dtype=np.float32, na_value=np.nan), nan=0.0
+        )
+
+        # Support both 0-1 and 0-100 ranges: scale fraction columns to percent,
+        # clip to valid percentages, then convert back to 0-1
+        fraction_columns = coverage.max(axis=0, initial=0.0) <= 1.0
+        coverage *= np.where(fraction_columns, 100.0, 1.0).astype(np.float32)
+        np.clip(coverage, 0.0, 100.0, out=coverage)
+        coverage *= np.float32(0.01)
+
+        return {variable: coverage[:, i] for i, variable in enumerate(variables)}
+
     def _plot_single_layer_no_legend(
         self,
         ax: Axes,
         data: pd.DataFrame,
         variable: str,
+        cloud_data_normalized: Optional[np.ndarray],
         grid_interval: int,
         padding_config: Optional[Dict[str, Any]] = None,
     ) -> None:
@@ -238,40 +519,25 @@ class CloudLayerPlotter:
 
         Note: grid_interval parameter is kept for API compatibility but grid lines
         are now handled centrally by the plotter's unified grid system.
+
+        Args:
+            ax: matplotlib Axes object
+            data: DataFrame with time index, used for the axis limits
+            variable: Cloud variable name, used for the layer colors
+            cloud_data_normalized: 0-1 coverage per time step, or None when the
+                variable is missing from data
+            grid_interval: Unused, kept for API compatibility
+            padding_config: Optional padding configuration
         """
         # Suppress unused parameter warning - kept for API compatibility
         _ = grid_interval
         # Get colors from configuration (always needed for legend)
         colors = self._get_cloud_colors(variable)
 
-        if variable in data.columns:
-            # Ensure numeric data and handle NaN values
-            cloud_data_numeric = pd.to_numeric(data[variable], errors="coerce").fillna(
-                0
-            )
-
-            # Support both 0-1 and 0-100 ranges for cloud coverage
-            if cloud_data_numeric.max() <= 1.0:
-                # Data is in 0-1 range, convert to 0-100
-                cloud_data_percent = cloud_data_numeric * 100
-            else:
-                # Data is already in 0-100 range
-                cloud_data_percent = cloud_data_numeric
-
-            # Clip to valid percentage range
-            cloud_data_percent = pd.Series(
-                np.clip(cloud_data_percent, 0, 100), index=cloud_data_percent.index
-            )
-
-            # Convert back to 0-1 for thickness calculation
-            cloud_data_normalized = cloud_data_percent / 100.0
-
+        if cloud_data_normalized is not None:
             time_indices = np.arange(len(cloud_data_normalized))
 
             # Create continuous thick line where thickness represents cloud coverage
-            # Use fill_between to create variable thickness horizontal band
-
-            # Create the upper and lower bounds for the filled area
             # Center the band vertically and vary thickness based on coverage
             center_y = 0.5  # Center of the panel
 
@@ -283,32 +549,25 @@ class CloudLayerPlotter:
             upper_bound = center_y + thickness / 2
             lower_bound = center_y - thickness / 2
 
-            # Fill the area between bounds to create thick line effect
-            ax.fill_between(
-                time_indices,
-                lower_bound,
-                upper_bound,
-                color=colors["color"],
-                alpha=colors["alpha"],
-                edgecolor=colors["edge_color"],
-                linewidth=colors["edge_width"],
-                step="mid",
+            # Draw the band as one stepped polygon (the shape fill_between
+            # draws with step="mid"), outlined by its own edge
+            step_x, step_lower, step_upper = cbook.pts_to_midstep(
+                time_indices, lower_bound, upper_bound
             )
-
-            # Add outline for better definition
-            ax.plot(
-                time_indices,
-                upper_bound,
-                color=colors["edge_color"],
-                linewidth=colors["edge_width"],
-                alpha=0.8,
+            band_vertices = np.concatenate(
+                [
+                    np.column_stack([step_x, step_upper]),
+                    np.column_stack([step_x[::-1], step_lower[::-1]]),
+                ]
             )
-            ax.plot(
-                time_indices,
-                lower_bound,
-                color=colors["edge_color"],
-                linewidth=colors["edge_width"],
-                alpha=0.8,
+            ax.add_collection(
+                PolyCollection(
+                    [band_vertices],
+                    facecolors=colors["color"],
+                    edgecolors=colors["edge_color"],
+                    linewidths=colors["edge_width"],
+                    alpha=colors["alpha"],
+                )
             )
 
         # Format axis to match meteogram style
@@ -329,97 +588,43 @@ class CloudLayerPlotter:
         ax.tick_params(axis="both", direction="in", length=3)
 
     def _get_cloud_colors(self, variable: str) -> dict:
-        """Get color configuration for a cloud variable from settings."""
-        # Default colors if configuration is not available (using settings.yaml colors)
-        default_colors = {
-            "cloud_high": {
-                "color": "#87CEEB",
-                "alpha": 1.0,
-                "edge_color": "#5F9EA0",
-                "edge_width": 0.5,
-            },
-            "cloud_medium": {
-                "color": "#4682B4",
-                "alpha": 1.0,
-                "edge_color": "#2F4F4F",
-                "edge_width": 0.5,
-            },
-            "cloud_low": {
-                "color": "#2F4F4F",
-                "alpha": 1.0,
-                "edge_color": "#1C1C1C",
-                "edge_width": 0.5,
-            },
-            "fog": {
-                "color": "#48CAE4",
-                "alpha": 1.0,
-                "edge_color": "#0077BE",
-                "edge_width": 0.5,
-            },
-        }
-
-        # Try to get colors from configuration
-        try:
-            if hasattr(self.config, "variable_config") and self.config.variable_config:
-                var_config = self.config.variable_config.get(variable, {})
-                if var_config:  # Only use config if it exists and is not empty
-                    logger.debug(
-                        "Using configuration colors for %s: %s", variable, var_config
-                    )
-                    return {
-                        "color": var_config.get(
-                            "color",
-                            default_colors.get(variable, default_colors["cloud_low"])[
-                                "color"
-                            ],
-                        ),
-                        "alpha": var_config.get(
-                            "alpha",
-                            default_colors.get(variable, default_colors["cloud_low"])[
-                                "alpha"
-                            ],
-                        ),
-                        "edge_color": var_config.get(
-                            "edge_color",
-                            default_colors.get(variable, default_colors["cloud_low"])[
-                                "edge_color"
-                            ],
-                        ),
-                        "edge_width": var_config.get(
-                            "edge_width",
-                            default_colors.get(variable, default_colors["cloud_low"])[
-                                "edge_width"
-                            ],
-                        ),
-                    }
-                else:
-                    logger.debug(
-                        "No configuration found for %s, using defaults", variable
-                    )
-            else:
-                logger.debug(
-                    "No variable_config available, using defaults for %s", variable
-                )
-        except (AttributeError, KeyError) as e:
-            logger.debug("Error accessing configuration for %s: %s", variable, e)
+        """Get color configuration for a cloud variable from settings.
 
-        # Return default colors for the variable (now using settings.yaml values)
-        colors = default_colors.get(variable, default_colors["cloud_low"])
-        logger.debug("Using default colors for %s: %s", variable, colors)
+        Results are memoized per variable until the variable_config object
+        changes, since each cloud panel and its legend entry look up the same
+        colors.
+        """
+        variable_config = getattr(self.config, "variable_config", None)
+        if variable_config is not self._cloud_colors_source:
+            self._cloud_colors_source = variable_config
+            self._cloud_colors_cache = {}
+
+        colors = self._cloud_colors_cache.get(variable)
+        if colors is None:
+            colors = self._resolve_cloud_colors(variable_config, variable)
+            self._cloud_colors_cache[variable] = colors
         return colors
 
+    @staticmethod
+    def _resolve_cloud_colors(
+        variable_config: Optional[Dict[str, Dict[str, Any]]], variable: str
+    ) -> dict:
+        """Merge configured cloud colors over the defaults for a variable."""
+        # Default colors if configuration is not available (settings.yaml colors)
+        colors = _DEFAULT_CLOUD_COLORS.get(variable, _DEFAULT_CLOUD_COLORS["cloud_low"])
+
+        var_config = variable_config.get(variable) if variable_config else None
+        if var_config:  # Only use config if it exists and is not empty
+            logger.debug("Using configuration colors for %s: %s", variable, var_config)
+            return {key: var_config.get(key, value) for key, value in colors.items()}
+
+        logger.debug("Using default colors for %s: %s", variable, colors)
+        return dict(colors)
+
     def _add_all_legends(
         self, labels: List[str], label_padding: Optional[Any] = None
     ) -> None:
         """Add all legends after plotting is complete, using stored axis positions."""
-        # Map labels to variables for color lookup
-        label_to_var = {
-            "Høy": "cloud_high",
-            "Mellom": "cloud_medium",
-            "Lav": "cloud_low",
-            "Tåke": "fog",
-        }
-
         # Use configurable padding or defaults
         cloud_label_x = 0.12  # Default
         cloud_label_offset = 0.01  # Default
@@ -437,39 +642,43 @@ class CloudLayerPlotter:
                     label_padding, "cloud_label_offset", cloud_label_offset
                 )
 
+        # Colored squares are collected (in figure coordinates) and added as
+        # one collection after the loop
+        legend_figure: Optional[Union[Figure, SubFigure]] = None
+        legend_squares: List[Rectangle] = []
+
         for label in labels:
             if label in self.axis_positions:
-                ax = self.axis_positions[label]
-                variable = label_to_var.get(label, "cloud_low")
-                colors = self._get_cloud_colors(variable)
+                ax, colors = self.axis_positions[label]
 
-                # Get the current axis position after all formatting is applied
+                # The axis position follows from the GridSpec (and any
+                # subplots_adjust), so no draw is needed to read it
                 fig = ax.get_figure()
-                if fig is not None:
-                    fig.canvas.draw()  # Force drawing to get final positions
+                if fig is None:
+                    continue
                 bbox = ax.get_position()
 
                 # Position legend at exact center of axis
                 legend_y = bbox.y0 + bbox.height * 0.5
 
                 # Add legend text with configurable positioning
-                if fig is not None:
-                    fig.text(
-                        cloud_label_x,
-                        legend_y,
-                        label,
-                        fontsize=9,
-                        va="center",
-                        ha="right",
-                        color="#808080",
-                        fontweight="normal",
-                        transform=fig.transFigure,
-                    )
+                fig.text(
+                    cloud_label_x,
+                    legend_y,
+                    label,
+                    fontsize=9,
+                    va="center",
+                    ha="right",
+                    color="#808080",
+                    fontweight="normal",
+                    transform=fig.transFigure,
+                )
 
                 # Add colored square with configurable offset
-                if fig is not None:
-                    square_x = cloud_label_x + cloud_label_offset
-                    colored_rect = plt.Rectangle(
+                square_x = cloud_label_x + cloud_label_offset
+                legend_figure = fig
+                legend_squares.append(
+                    Rectangle(
                         (square_x, legend_y - 0.003),
                         0.008,
                         0.006,
@@ -477,53 +686,27 @@ class CloudLayerPlotter:
                         alpha=colors["alpha"],
                         edgecolor=colors["edge_color"],
                         linewidth=colors["edge_width"],
-                        transform=fig.transFigure,
-                        clip_on=False,
                     )
-                    fig.patches.append(colored_rect)
-
-    def _add_colored_legend(self, ax: Axes, label: str, colors: dict) -> None:
-        """Add text label and colored square inline with the related cloud layer."""
-        # Get the axis position in figure coordinates
-        bbox = ax.get_position()
-
-        # Position legend at the center of the axis
-        legend_y = bbox.y0 + bbox.height * 0.5
-
-        # Add legend text
-        fig = ax.get_figure()
-        if fig is not None:
-            fig.text(
-                0.12,
-                legend_y,
-                label,
-                fontsize=9,
-                va="center",
-                ha="right",
-                color="#808080",
-                fontweight="normal",
-                transform=fig.transFigure,
-            )
+                )
 
-        # Add colored square next to text
-        if fig is not None:
-            colored_rect = plt.Rectangle(
-                (0.13, legend_y - 0.003),
-                0.008,
-                0.006,
-                facecolor=colors["color"],
-                alpha=colors["alpha"],
-                edgecolor=colors["edge_color"],
-                linewidth=colors["edge_width"],
-                transform=fig.transFigure,
-                clip_on=False,
+        if legend_figure is not None:
+            legend_figure.add_artist(
+                PatchCollection(
+                    legend_squares,
+                    match_original=True,
+                    transform=legend_figure.transFigure,
+                    clip_on=False,
+                )
             )
-            fig.patches.append(colored_rect)
 
 
 class FormattingUtils:
     """Utility functions for plot formatting."""
 
+    # Callback registries of the axes already styled. Axes.clear() replaces an
+    # axis' registry, so both cleared and recreated axes are styled again.
+    _styled_axes: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
     @staticmethod
     def calculate_padded_xlim(data: pd.DataFrame, padding_config: dict) -> tuple:
         """Calculate x-axis limits with configurable padding.
@@ -540,33 +723,41 @@ class FormattingUtils:
             return (0, 1)
 
         # Get padding configuration
-        start_padding = padding_config.get("start_padding", 0.05)
-        end_padding = padding_config.get("end_padding", 0.05)
         start_padding_hours = padding_config.get("start_padding_hours")
         end_padding_hours = padding_config.get("end_padding_hours")
 
-        # Calculate padding in data points
-        if start_padding_hours is not None and len(data) > 1:
-            # Convert hours to data points based on time resolution
-            time_diff = (data.index[1] - data.index[0]).total_seconds() / 3600  # hours
-            start_padding_points = start_padding_hours / time_diff
-        else:
-            # Use fractional padding
-            start_padding_points = start_padding * (data_length - 1)
+        # Time resolution in hours, only needed for hour-based padding
+        step_hours = None
+        if data_length > 1 and (
+            start_padding_hours is not None or end_padding_hours is not None
+        ):
+            step_hours = (data.index[1] - data.index[0]).total_seconds() / 3600
+
+        return _padded_xlim(
+            data_length,
+            step_hours,
+            padding_config.get("start_padding", 0.05),
+            padding_config.get("end_padding", 0.05),
+            start_padding_hours,
+            end_padding_hours,
+        )
 
-        if end_padding_hours is not None and len(data) > 1:
-            # Convert hours to data points based on time resolution
-            time_diff = (data.index[1] - data.index[0]).total_seconds() / 3600  # hours
-            end_padding_points = end_padding_hours / time_diff
-        else:
-            # Use fractional padding
-            end_padding_points = end_padding * (data_length - 1)
+    @staticmethod
+    def _build_time_ticks(
+        data: pd.DataFrame, interval: int
+    ) -> Tuple[np.ndarray, List[str]]:
+        """Build hourly tick positions and their "%H" labels.
 
-        # Calculate limits
-        start_limit = -start_padding_points
-        end_limit = (data_length - 1) + end_padding_points
+        Args:
+            data: DataFrame with time index
+            interval: Number of data points between ticks
 
-        return (start_limit, end_limit)
+        Returns:
+            Tuple of (tick positions, hour labels)
+        """
+        tick_positions = np.arange(0, len(data), interval, dtype=np.int64)
+        time_labels = data.index[tick_positions].strftime("%H").tolist()
+        return tick_positions, time_labels
 
     @staticmethod
     def format_time_axis(
@@ -592,23 +783,15 @@ class FormattingUtils:
         else:
             ax.set_xlim(0, len(data) - 1)
 
-        # Create time labels
-        time_labels = []
-        for i in range(0, len(data), grid_interval):
-            if i < len(data):
-                timestamp = data.index[i]
-                time_labels.append(timestamp.strftime("%H"))
-            else:
-                time_labels.append("")
-
         # Set x-axis ticks and labels
-        tick_positions = list(range(0, len(data), grid_interval))
+        tick_positions, time_labels = FormattingUtils._build_time_ticks(
+            data, grid_interval
+        )
         ax.set_xticks(tick_positions)
         ax.set_xticklabels(time_labels, fontsize=8)
 
         # Add vertical grid lines
-        for pos in tick_positions:
-            ax.axvline(x=pos, color="grey", linestyle="-", alpha=0.3, linewidth=0.5)
+        _add_vertical_lines(ax, tick_positions, color="grey", alpha=0.3, linewidths=0.5)
 
     @staticmethod
     def add_time_labels(
@@ -634,17 +817,10 @@ class FormattingUtils:
         else:
             ax.set_xlim(0, len(data) - 1)
 
-        # Create time labels
-        time_labels = []
-        tick_positions = []
-
-        for i in range(0, len(data), time_interval):
-            if i < len(data):
-                timestamp = data.index[i]
-                time_labels.append(timestamp.strftime("%H"))
-                tick_positions.append(i)
-
         # Set x-axis ticks and labels
+        tick_positions, time_labels = FormattingUtils._build_time_ticks(
+            data, time_interval
+        )
         ax.set_xticks(tick_positions)
         ax.set_xticklabels(time_labels, fontsize=8)
 
@@ -670,23 +846,23 @@ class FormattingUtils:
             grid_transparency: Alpha transparency of grid lines
             day_boundary_indices: List of indices where day boundaries occur (for thicker lines)
         """
-        day_boundary_indices = day_boundary_indices or []
+        positions = np.arange(0, total_time_points, grid_line_interval)
 
-        # Add vertical grid lines
-        for time_point_index in range(0, total_time_points, grid_line_interval):
-            # Make day boundary lines thicker
-            if time_point_index in day_boundary_indices:
-                grid_line_width = 1.5  # Thicker line for day boundaries
-            else:
-                grid_line_width = 0.5  # Normal line thickness
-
-            target_axis.axvline(
-                x=time_point_index,
-                color=grid_line_color,
-                linestyle="-",
-                alpha=grid_transparency,
-                linewidth=grid_line_width,
+        # Make day boundary lines thicker
+        if day_boundary_indices:
+            grid_line_widths: Any = np.where(
+                np.isin(positions, day_boundary_indices), 1.5, 0.5
             )
+        else:
+            grid_line_widths = 0.5
+
+        _add_vertical_lines(
+            target_axis,
+            positions,
+            color=grid_line_color,
+            alpha=grid_transparency,
+            linewidths=grid_line_widths,
+        )
 
     @staticmethod
     def add_horizontal_grid(
@@ -747,50 +923,12 @@ class FormattingUtils:
         Returns:
             List of nice round values for grid lines
         """
-        import math
-
-        # Calculate the range
-        y_axis_value_range = y_axis_maximum - y_axis_minimum
-        if y_axis_value_range == 0:
-            return []
-
-        # Calculate a nice step size
-        approximate_step_size = y_axis_value_range / maximum_grid_lines
-
-        # Find the order of magnitude
-        step_magnitude = math.floor(math.log10(approximate_step_size))
-
-        # Normalize the rough step to between 1 and 10
-        normalized_step_size = approximate_step_size / (10**step_magnitude)
-
-        # Choose a nice step size
-        if normalized_step_size <= 1:
-            rounded_step_size = 1
-        elif normalized_step_size <= 2:
-            rounded_step_size = 2
-        elif normalized_step_size <= 5:
-            rounded_step_size = 5
-        else:
-            rounded_step_size = 10
-
-        # Scale back up
-        final_step_size = rounded_step_size * (10**step_magnitude)
-
-        # Find the starting point (round down to nearest step)
-        grid_start_value = (
-            math.floor(y_axis_minimum / final_step_size) * final_step_size
+        return list(
+            _nice_grid_values(
+                float(y_axis_minimum), float(y_axis_maximum), maximum_grid_lines
+            )
         )
 
-        # Generate grid values
-        calculated_grid_values = []
-        current_grid_value = grid_start_value
-        while current_grid_value <= y_axis_maximum:
-            if current_grid_value >= y_axis_minimum:  # Only include values within range
-                calculated_grid_values.append(current_grid_value)
-            current_grid_value += final_step_size
-
-        return calculated_grid_values
-
     @staticmethod
     def add_date_labels(ax: Axes, data: pd.DataFrame) -> None:
         """Add date labels below the time axis.
@@ -799,24 +937,23 @@ class FormattingUtils:
             ax: matplotlib Axes object
             data: DataFrame with time index
         """
-        # Get unique dates in the data
-        dates = pd.to_datetime(data.index).date
-        unique_dates = []
-        date_positions = []
-
-        current_date: Optional[Any] = None
-        for i, date in enumerate(dates):
-            if date != current_date:
-                unique_dates.append(date)
-                date_positions.append(i)
-                current_date = date
+        if len(data.index) == 0:
+            return
+
+        # Find where the calendar day changes, comparing midnight timestamps
+        timestamps = pd.DatetimeIndex(pd.to_datetime(data.index))
+        day_values = timestamps.normalize().asi8
+        date_positions = np.flatnonzero(
+            np.concatenate(([True], np.diff(day_values) != 0))
+        )
+        unique_dates = timestamps[date_positions].strftime("%Y-%m-%d")
 
         # Add date labels
-        for pos, date in zip(date_positions, unique_dates):
+        for pos, date_label in zip(date_positions.tolist(), unique_dates):
             ax.text(
                 pos,
                 -0.15,
-                date.strftime("%Y-%m-%d"),
+                date_label,
                 ha="left",
                 va="top",
                 fontsize=8,
@@ -827,18 +964,25 @@ class FormattingUtils:
     def apply_norwegian_styling(ax: Axes, ylabel: Optional[str] = None) -> None:
         """Apply meteogram styling to an axis.
 
+        Tick, grid and spine styling is applied once per axis; later calls on
+        the same axis only update the ylabel.
+
         Args:
             ax: matplotlib Axes object
             ylabel: Y-axis label
         """
-        # Set basic styling
-        ax.tick_params(axis="both", direction="in", length=3)
-        ax.grid(True, alpha=0.3, linestyle="-", linewidth=0.5)
-
         # Set ylabel if provided
         if ylabel:
             ax.set_ylabel(ylabel, fontsize=9, color="#808080")
 
+        if ax.callbacks in FormattingUtils._styled_axes:
+            return
+        FormattingUtils._styled_axes.add(ax.callbacks)
+
+        # Set basic styling
+        ax.tick_params(axis="both", direction="in", length=3)
+        ax.grid(True, alpha=0.3, linestyle="-", linewidth=0.5)
+
         # Remove top and right spines
         ax.spines["top"].set_visible(False)
         ax.spines["right"].set_visible(False)
@@ -855,46 +999,53 @@ class BottomLegendPlotter:
         """Initialize bottom legend plotter."""
         self.config = config
 
+    @property
+    def config(self) -> PlotConfig:
+        """Plot configuration; assigning a new one clears the cached styling."""
+        return self._config
+
+    @config.setter
+    def config(self, config: PlotConfig) -> None:
+        self._config = config
+        self._legend_style: Optional[Tuple[Dict[str, str], Any, str, str]] = None
+        self._cloud_color_map: Optional[Dict[str, str]] = None
+        self._legend_items_cache: Dict[FrozenSet[str], List[dict]] = {}
+
+    def _get_legend_style(self) -> Tuple[Dict[str, str], Any, str, str]:
+        """Get effective colors, font size, font weight and text color.
+
+        Resolved once per configuration and reused on later renders.
+        """
+        if self._legend_style is None:
+            configured_color_scheme = self.config.get_effective_colors()
+            font_configuration = getattr(self.config, "fonts", None) or {}
+            font_weights = font_configuration.get("weights") or {}
+            self._legend_style = (
+                configured_color_scheme,
+                font_configuration.get("annotation_size", 8),
+                font_weights.get("annotation", "normal"),
+                configured_color_scheme.get("text", "#333333"),
+            )
+        return self._legend_style
+
     def _get_legend_positioning(
         self, legend_positioning_config: Optional[Any] = None
     ) -> tuple:
         """Get legend positioning configuration."""
-        legend_vertical_position = 0.08
-        legend_horizontal_start_position = 0.15
-        legend_item_horizontal_spacing = 0.12
-
-        if legend_positioning_config:
-            if isinstance(legend_positioning_config, dict):
-                legend_vertical_position = legend_positioning_config.get(
-                    "bottom_legend_y", legend_vertical_position
-                )
-                legend_horizontal_start_position = legend_positioning_config.get(
-                    "bottom_legend_x_start", legend_horizontal_start_position
-                )
-                legend_item_horizontal_spacing = legend_positioning_config.get(
-                    "bottom_legend_spacing", legend_item_horizontal_spacing
-                )
-            else:
-                legend_vertical_position = getattr(
-                    legend_positioning_config,
-                    "bottom_legend_y",
-                    legend_vertical_position,
-                )
-                legend_horizontal_start_position = getattr(
-                    legend_positioning_config,
-                    "bottom_legend_x_start",
-                    legend_horizontal_start_position,
-                )
-                legend_item_horizontal_spacing = getattr(
-                    legend_positioning_config,
-                    "bottom_legend_spacing",
-                    legend_item_horizontal_spacing,
-                )
+        legend_y, legend_x_start, legend_spacing = 0.08, 0.15, 0.12
+        if not legend_positioning_config:
+            return legend_y, legend_x_start, legend_spacing
+
+        # Handle both dictionary and object-style positioning config
+        if isinstance(legend_positioning_config, dict):
+            get_setting = legend_positioning_config.get
+        else:
+            get_setting = partial(getattr, legend_positioning_config)
 
         return (
-            legend_vertical_position,
-            legend_horizontal_start_position,
-            legend_item_horizontal_spacing,
+            get_setting("bottom_legend_y", legend_y),
+            get_setting("bottom_legend_x_start", legend_x_start),
+            get_setting("bottom_legend_spacing", legend_spacing),
         )
 
     def add_bottom_legend(
@@ -902,13 +1053,22 @@ class BottomLegendPlotter:
         meteogram_figure: Figure,
         weather_data: pd.DataFrame,
         legend_positioning_config: Optional[Any] = None,
-    ) -> None:
+        blit: bool = False,
+    ) -> List[Artist]:
         """Add bottom legend column with colors and definitions.
 
+        The legend artists are only added to the figure, not drawn. Callers
+        should make all their add_* calls and then call finalize_draw once.
+
         Args:
             meteogram_figure: matplotlib Figure object
             weather_data: Weather data DataFrame to determine which variables to show
             legend_positioning_config: LabelPaddingConfig for custom positioning
+            blit: Mark the legend artists as animated so the caller can draw
+                them with blitting instead of a full figure redraw
+
+        Returns:
+            The artists added to the figure
         """
         (
             legend_vertical_position,
@@ -916,255 +1076,255 @@ class BottomLegendPlotter:
             legend_item_horizontal_spacing,
         ) = self._get_legend_positioning(legend_positioning_config)
 
-        # Get effective colors from configuration
-        configured_color_scheme = self.config.get_effective_colors()
+        # Get effective colors and font configuration
+        (
+            configured_color_scheme,
+            legend_text_font_size,
+            legend_text_font_weight,
+            legend_text_color,
+        ) = self._get_legend_style()
+
+        # Legend items only depend on which variables are present
+        legend_columns = _LEGEND_COLUMNS.intersection(weather_data.columns)
+        weather_legend_items = self._legend_items_cache.get(legend_columns)
+        if weather_legend_items is None:
+            weather_legend_items = self._build_legend_items(
+                legend_columns, configured_color_scheme
+            )
+            self._legend_items_cache[legend_columns] = weather_legend_items
 
-        # Get font configuration
-        font_configuration = getattr(self.config, "fonts", {}) or {}
-        legend_text_font_size = font_configuration.get("annotation_size", 8)
-        legend_text_font_weight = font_configuration.get("weights", {}).get(
-            "annotation", "normal"
+        # Lay out legend items
+        legend_item_positions = self._layout_legend_items(
+            len(weather_legend_items),
+            legend_horizontal_start_position,
+            legend_vertical_position,
+            legend_item_horizontal_spacing,
         )
-        legend_text_color = configured_color_scheme.get("text", "#333333")
 
-        # Define legend items based on available data and configuration
-        weather_legend_items = []
+        # Draw legend items, sharing one font definition between all labels
+        legend_font_properties = _font_properties(
+            legend_text_font_size, legend_text_font_weight
+        )
+        legend_artists = self._draw_legend_items(
+            meteogram_figure,
+            weather_legend_items,
+            legend_item_positions,
+            legend_font_properties,
+            legend_text_color,
+        )
 
-        # Temperature legend items (always show if temperature data exists)
-        if "temperature" in weather_data.columns:
-            weather_legend_items.extend(
-                [
-                    {
-                        "color": configured_color_scheme.get(
-                            "temperature_above", "#d62728"
-                        ),
-                        "label": "Temperature ≥0°C",
-                        "type": "line",
-                    },
-                    {
-                        "color": configured_color_scheme.get(
-                            "temperature_below", "#1f77b4"
-                        ),
-                        "label": "Temperature <0°C",
-                        "type": "line",
-                    },
-                ]
-            )
+        if blit:
+            for legend_artist in legend_artists:
+                legend_artist.set_animated(True)
 
-        # Dew point legend item
-        if "dew_point" in weather_data.columns:
-            weather_legend_items.append(
-                {
-                    "color": configured_color_scheme.get("dew_point", "#17becf"),
-                    "label": "Dew Point",
-                    "type": "dashed_line",
-                }
-            )
+        return legend_artists
 
-        # Wind speed legend item
-        if "wind_speed" in weather_data.columns:
-            weather_legend_items.append(
-                {
-                    "color": configured_color_scheme.get("wind", "#ff7f0e"),
-                    "label": "Wind Speed",
-                    "type": "line",
-                }
-            )
+    @staticmethod
+    def _layout_legend_items(
+        item_count: int, x_start: float, y_start: float, x_spacing: float
+    ) -> List[Tuple[float, float]]:
+        """Compute figure positions for legend items, wrapping into rows.
 
-        # Pressure legend item
-        if "pressure" in weather_data.columns:
-            weather_legend_items.append(
-                {
-                    "color": configured_color_scheme.get("pressure", "#2ca02c"),
-                    "label": "Pressure",
-                    "type": "line",
-                }
-            )
+        Items are placed left to right and start a new row 0.03 lower once the
+        x position passes 0.85, leaving some margin on the right.
 
-        # Precipitation legend item
-        if "precipitation" in weather_data.columns:
-            weather_legend_items.append(
-                {
-                    "color": configured_color_scheme.get("precipitation", "#1f77b4"),
-                    "label": "Precipitation",
-                    "type": "bar",
-                }
-            )
+        Args:
+            item_count: Number of legend items
+            x_start: x position of the first item in each row
+            y_start: y position of the first row
+            x_spacing: Horizontal distance between items
+
+        Returns:
+            (x, y) figure coordinates for each item
+        """
+        max_row_x = 0.85
+        row_spacing = 0.03
 
-        # Cloud layer legend items
-        available_cloud_variables = ["cloud_high", "cloud_medium", "cloud_low", "fog"]
-        cloud_layer_display_labels = [
-            "High Clouds",
-            "Medium Clouds",
-            "Low Clouds",
-            "Fog",
+        if item_count == 0:
+            return []
+
+        if x_start > max_row_x:
+            # Every item wraps, including the first one
+            row_x_positions = np.array([x_start])
+            first_row = 1
+        else:
+            # Accumulate the steps along a row so rounding decides the same
+            # way as placing items one by one when one lands on the margin
+            x_steps = np.full(item_count, x_spacing, dtype=np.float64)
+            x_steps[0] = x_start
+            row_x_positions = np.cumsum(x_steps)
+            past_margin = row_x_positions > max_row_x
+            if past_margin.any():
+                row_x_positions = row_x_positions[: int(past_margin.argmax())]
+            first_row = 0
+
+        rows, columns = np.divmod(np.arange(item_count), len(row_x_positions))
+        x_positions = row_x_positions[columns]
+        y_positions = y_start - (rows + first_row) * row_spacing
+        return list(zip(x_positions.tolist(), y_positions.tolist()))
+
+    def _build_legend_items(
+        self, available_columns: FrozenSet[str], color_scheme: Dict[str, str]
+    ) -> List[dict]:
+        """Build legend item definitions for the available variables.
+
+        Args:
+            available_columns: Legend variables present in the data
+            color_scheme: Effective colors from the configuration
+
+        Returns:
+            Dictionaries with 'color', 'label', and 'type' keys
+        """
+        legend_items = [
+            {
+                "color": color_scheme.get(color_key, default_color),
+                "label": label,
+                "type": symbol_type,
+            }
+            for column, color_key, default_color, label, symbol_type in _LEGEND_SPEC
+            if column in available_columns
         ]
+        legend_items.extend(
+            {
+                "color": self._get_cloud_color_for_legend(column),
+                "label": label,
+                "type": "filled_area",
+            }
+            for column, label in _CLOUD_LEGEND_SPEC
+            if column in available_columns
+        )
+        return legend_items
 
-        for cloud_variable, display_label in zip(
-            available_cloud_variables, cloud_layer_display_labels
-        ):
-            if cloud_variable in weather_data.columns:
-                # Get cloud colors from variable config
-                cloud_layer_color_config = self._get_cloud_colors_for_legend(
-                    cloud_variable
-                )
-                weather_legend_items.append(
-                    {
-                        "color": cloud_layer_color_config["color"],
-                        "label": display_label,
-                        "type": "filled_area",
-                    }
-                )
+    @staticmethod
+    def finalize_draw(meteogram_figure: Figure) -> None:
+        """Request a single redraw once all legend artists have been added.
 
-        # Draw legend items
-        current_legend_x_position = legend_horizontal_start_position
-        for legend_item in weather_legend_items:
-            # Break to new row if we exceed figure width
-            if current_legend_x_position > 0.85:  # Leave some margin on the right
-                legend_vertical_position -= 0.03  # Move to next row
-                current_legend_x_position = legend_horizontal_start_position
-
-            self._draw_legend_item(
-                meteogram_figure,
-                current_legend_x_position,
-                legend_vertical_position,
-                legend_item,
-                legend_text_font_size,
-                legend_text_font_weight,
-                legend_text_color,
-            )
-            current_legend_x_position += legend_item_horizontal_spacing
-
-    def _get_cloud_colors_for_legend(self, variable: str) -> dict:
-        """Get cloud colors for legend display."""
-        # Default colors matching CloudLayerPlotter
-        default_colors = {
-            "cloud_high": {"color": "#87CEEB"},
-            "cloud_medium": {"color": "#4682B4"},
-            "cloud_low": {"color": "#2F4F4F"},
-            "fog": {"color": "#48CAE4"},
-        }
-
-        # Try to get colors from configuration
-        try:
-            if hasattr(self.config, "variable_config") and self.config.variable_config:
-                var_config = self.config.variable_config.get(variable, {})
-                if var_config:
-                    return {
-                        "color": var_config.get(
-                            "color",
-                            default_colors.get(variable, default_colors["cloud_low"])[
-                                "color"
-                            ],
-                        )
-                    }
-        except (AttributeError, KeyError):
-            pass
-
-        return default_colors.get(variable, default_colors["cloud_low"])
-
-    def _draw_legend_item(
+        Args:
+            meteogram_figure: matplotlib Figure object
+        """
+        meteogram_figure.canvas.draw_idle()
+
+    def _get_cloud_color_for_legend(self, variable: str) -> str:
+        """Get the cloud color for legend display."""
+        if self._cloud_color_map is None:
+            self._cloud_color_map = self._build_cloud_color_map()
+        return self._cloud_color_map.get(variable, self._cloud_color_map["cloud_low"])
+
+    def _build_cloud_color_map(self) -> Dict[str, str]:
+        """Resolve legend colors for every cloud layer from the configuration."""
+        variable_config = getattr(self.config, "variable_config", None) or {}
+        cloud_color_map: Dict[str, str] = {}
+        for variable, default_colors in _DEFAULT_CLOUD_COLORS.items():
+            var_config = variable_config.get(variable) or {}
+            cloud_color_map[variable] = var_config.get("color", default_colors["color"])
+        return cloud_color_map
+
+    def _draw_legend_items(
         self,
         meteogram_figure: Figure,
-        legend_item_x_position: float,
-        legend_item_y_position: float,
-        legend_item_config: dict,
-        text_font_size: int,
-        text_font_weight: str,
+        legend_items: List[dict],
+        legend_item_positions: List[Tuple[float, float]],
+        text_font_properties: FontProperties,
         text_display_color: str,
-    ) -> None:
-        """Draw a single legend item with appropriate symbol and label.
+    ) -> List[Artist]:
+        """Draw legend items with their symbols and labels.
+
+        Symbols are batched by kind: solid lines, dashed lines and rectangles
+        are each added to the figure as a single collection.
 
         Args:
             meteogram_figure: matplotlib Figure object
-            legend_item_x_position: X position in figure coordinates
-            legend_item_y_position: Y position in figure coordinates
-            legend_item_config: Dictionary with 'color', 'label', and 'type' keys
-            text_font_size: Font size for text
-            text_font_weight: Font weight for text
+            legend_items: Dictionaries with 'color', 'label', and 'type' keys
+            legend_item_positions: (x, y) figure coordinates for each item
+            text_font_properties: Font for the text labels
             text_display_color: Color for text
+
+        Returns:
+            The text and collection artists added to the figure
         """
         legend_symbol_width = 0.03  # Width of the symbol
         legend_symbol_height = 0.008  # Height of the symbol
         symbol_text_spacing = 0.005  # Offset between symbol and text
+        figure_transform = meteogram_figure.transFigure
 
-        # Draw symbol based on type
-        if legend_item_config["type"] == "line":
-            # Draw a solid line
-            symbol_center_y = legend_item_y_position + legend_symbol_height / 2
-            meteogram_figure.add_artist(
-                plt.Line2D(
-                    [
-                        legend_item_x_position,
-                        legend_item_x_position + legend_symbol_width,
-                    ],
-                    [symbol_center_y, symbol_center_y],
-                    color=legend_item_config["color"],
-                    linewidth=2,
-                    transform=meteogram_figure.transFigure,
-                    clip_on=False,
+        solid_segments: List[List[Tuple[float, float]]] = []
+        solid_colors: List[str] = []
+        dashed_segments: List[List[Tuple[float, float]]] = []
+        dashed_colors: List[str] = []
+        symbol_rectangles: List[Rectangle] = []
+        legend_artists: List[Artist] = []
+
+        for legend_item_config, (x_position, y_position) in zip(
+            legend_items, legend_item_positions
+        ):
+            symbol_center_y = y_position + legend_symbol_height / 2
+            symbol_type = legend_item_config["type"]
+
+            # Collect symbol based on type
+            if symbol_type in ("line", "dashed_line"):
+                segment = [
+                    (x_position, symbol_center_y),
+                    (x_position + legend_symbol_width, symbol_center_y),
+                ]
+                if symbol_type == "line":
+                    solid_segments.append(segment)
+                    solid_colors.append(legend_item_config["color"])
+                else:
+                    dashed_segments.append(segment)
+                    dashed_colors.append(legend_item_config["color"])
+
+            elif symbol_type in ("bar", "filled_area"):
+                # Bars are drawn translucent, cloud coverage areas opaque
+                symbol_rectangles.append(
+                    Rectangle(
+                        (x_position, y_position),
+                        legend_symbol_width,
+                        legend_symbol_height,
+                        facecolor=legend_item_config["color"],
+                        alpha=0.7 if symbol_type == "bar" else 1.0,
+                    )
                 )
+
+            # Add text label
+            label_text = meteogram_figure.text(
+                x_position + legend_symbol_width + symbol_text_spacing,
+                symbol_center_y,
+                legend_item_config["label"],
+                fontproperties=text_font_properties,
+                color=text_display_color,
+                va="center",
+                ha="left",
+                transform=figure_transform,
             )
+            legend_artists.append(label_text)
 
-        elif legend_item_config["type"] == "dashed_line":
-            # Draw a dashed line
-            symbol_center_y = legend_item_y_position + legend_symbol_height / 2
-            meteogram_figure.add_artist(
-                plt.Line2D(
-                    [
-                        legend_item_x_position,
-                        legend_item_x_position + legend_symbol_width,
-                    ],
-                    [symbol_center_y, symbol_center_y],
-                    color=legend_item_config["color"],
-                    linewidth=2,
-                    linestyle="--",
-                    transform=meteogram_figure.transFigure,
+        # Add each kind of symbol as one artist
+        for segments, colors, linestyle, capstyle in (
+            (solid_segments, solid_colors, "solid", "projecting"),
+            (dashed_segments, dashed_colors, "--", "butt"),
+        ):
+            if segments:
+                line_symbols = LineCollection(
+                    segments,
+                    colors=colors,
+                    linewidths=2,
+                    linestyles=linestyle,
+                    capstyle=capstyle,
+                    transform=figure_transform,
                     clip_on=False,
                 )
-            )
+                legend_artists.append(meteogram_figure.add_artist(line_symbols))
 
-        elif legend_item_config["type"] == "bar":
-            # Draw a small rectangle representing a bar
-            bar_symbol_rectangle = plt.Rectangle(
-                (legend_item_x_position, legend_item_y_position),
-                legend_symbol_width,
-                legend_symbol_height,
-                facecolor=legend_item_config["color"],
-                alpha=0.7,
-                transform=meteogram_figure.transFigure,
-                clip_on=False,
-            )
-            meteogram_figure.patches.append(bar_symbol_rectangle)
-
-        elif legend_item_config["type"] == "filled_area":
-            # Draw a filled rectangle representing cloud coverage
-            filled_area_symbol_rectangle = plt.Rectangle(
-                (legend_item_x_position, legend_item_y_position),
-                legend_symbol_width,
-                legend_symbol_height,
-                facecolor=legend_item_config["color"],
-                alpha=1.0,
-                transform=meteogram_figure.transFigure,
+        if symbol_rectangles:
+            area_symbols = PatchCollection(
+                symbol_rectangles,
+                match_original=True,
+                transform=figure_transform,
                 clip_on=False,
             )
-            meteogram_figure.patches.append(filled_area_symbol_rectangle)
+            legend_artists.append(meteogram_figure.add_artist(area_symbols))
 
-        # Add text label
-        legend_text_x_position = (
-            legend_item_x_position + legend_symbol_width + symbol_text_spacing
-        )
-        meteogram_figure.text(
-            legend_text_x_position,
-            legend_item_y_position + legend_symbol_height / 2,
-            legend_item_config["label"],
-            fontsize=text_font_size,
-            fontweight=text_font_weight,
-            color=text_display_color,
-            va="center",
-            ha="left",
-            transform=meteogram_figure.transFigure,
-        )
+        return legend_artists
 
 
 class GridManager:
@@ -1183,15 +1343,19 @@ class GridManager:
     ) -> None:
         """Add unified vertical grid lines across all panels.
 
+        The grid lines are only added to the axes, not drawn. Callers should
+        make all their add_* calls and then call finalize_draw once.
+
         Args:
             meteogram_axes_dict: Dictionary of axes objects
             time_series_data: DataFrame with time data
             hourly_grid_interval: Interval for grid lines (in hours)
             axis_padding_config: Optional padding configuration
         """
-        # Calculate grid positions
-        vertical_grid_line_positions = list(
-            range(0, len(time_series_data), hourly_grid_interval)
+        # Calculate grid positions, shared by all panels
+        data_length = len(time_series_data)
+        vertical_grid_line_positions = np.arange(
+            0, data_length, hourly_grid_interval, dtype=np.float64
         )
 
         # Calculate x-limits with padding
@@ -1202,21 +1366,29 @@ class GridManager:
                 )
             )
         else:
-            x_axis_start_limit, x_axis_end_limit = 0, len(time_series_data) - 1
+            x_axis_start_limit, x_axis_end_limit = 0, data_length - 1
 
         # Add vertical grid lines to all axes
         for axis_identifier, panel_axis in meteogram_axes_dict.items():
             if axis_identifier not in [
                 "time_axis"
             ]:  # Skip time axis as it handles its own grid
-                for grid_line_position in vertical_grid_line_positions:
-                    panel_axis.axvline(
-                        x=grid_line_position,
-                        color="grey",
-                        linestyle="-",
-                        alpha=0.3,
-                        linewidth=0.5,
-                    )
+                _add_vertical_lines(
+                    panel_axis,
+                    vertical_grid_line_positions,
+                    color="grey",
+                    alpha=0.3,
+                    linewidths=0.5,
+                )
 
                 # Set consistent x-limits with padding
                 panel_axis.set_xlim(x_axis_start_limit, x_axis_end_limit)
+
+    @staticmethod
+    def finalize_draw(meteogram_figure: Figure) -> None:
+        """Request a single redraw once all grid lines have been added.
+
+        Args:
+            meteogram_figure: matplotlib Figure object
+        """
+        meteogram_figure.canvas.draw_idle()
@@ -5,6 +5,7 @@ This module provides utilities to automatically configure the best
 plotting settings based on the user's system capabilities.
 """
 
+import copy
 import logging
 from typing import Optional
 
@@ -13,6 +14,21 @@ from .symbols import UnifiedWeatherSymbols
 
 logger = logging.getLogger(__name__)
 
+# Preset configurations; PlotConfig and its nested settings are mutable, so
+# callers get deep copies
+_COMPATIBILITY_CONFIG = PlotConfig(
+    symbol_type=SymbolType.SVG,
+    symbol_size=18,
+    figure_size=(12, 8),
+    auto_download_icons=True,
+)
+_QUALITY_CONFIG = PlotConfig(
+    symbol_type=SymbolType.SVG,
+    symbol_size=22,
+    figure_size=(14, 8),
+    auto_download_icons=True,
+)
+
 
 def create_optimal_config(
     symbol_size: int = 20,
@@ -101,12 +117,7 @@ def create_config_for_compatibility() -> PlotConfig:
     Returns:
         PlotConfig with SVG symbols (only supported type)
     """
-    return PlotConfig(
-        symbol_type=SymbolType.SVG,
-        symbol_size=18,
-        figure_size=(12, 8),
-        auto_download_icons=True,
-    )
+    return copy.deepcopy(_COMPATIBILITY_CONFIG)
 
 
 def create_config_for_quality() -> PlotConfig:
@@ -115,9 +126,4 @@ def create_config_for_quality() -> PlotConfig:
     Returns:
         PlotConfig with SVG symbols for best quality
     """
-    return PlotConfig(
-        symbol_type=SymbolType.SVG,
-        symbol_size=22,
-        figure_size=(14, 8),
-        auto_download_icons=True,
-    )
+    return copy.deepcopy(_QUALITY_CONFIG)
@@ -5,11 +5,12 @@ This module provides grid management functionality following the Single Responsi
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 import pandas as pd
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 
 from .components import FormattingUtils
 from .interfaces import PlotConfig
@@ -31,6 +32,10 @@ class MeteogramGridManager(GridManager):
         self.grid_interval = 1  # Grid every 1 hour
         self._shared_grid_values: Dict[str, Dict[str, Any]] = {}
 
+        # Day boundaries for the last index seen; pandas indexes are immutable,
+        # so holding the index and comparing identity is a safe cache key
+        self._day_boundary_cache: Optional[Tuple[pd.Index, List[int]]] = None
+
         # Initialize axis references for grid calculations
         self._wind_axis: Optional[Axes] = None
         self._pressure_axis: Optional[Axes] = None
@@ -66,12 +71,20 @@ class MeteogramGridManager(GridManager):
         else:
             start_limit, end_limit = 0, data_length - 1
 
+        # Get grid colors from configuration
+        effective_colors = self.config.get_effective_colors()
+        grid_color = effective_colors.get("grid", "#e0e0e0")
+        colors_config = getattr(self.config, "colors", {}) or {}
+        grid_alpha = colors_config.get("grid_alpha", 0.3)
+
         # Apply the same grid to ALL panels
         for i, ax in enumerate(axes):
             # Only add grid to axes that are not turned off
             if ax.get_visible():
-                # Set consistent x-limits for all panels with padding
-                ax.set_xlim(start_limit, end_limit)
+                # Set consistent x-limits for all panels with padding, skipping
+                # the update when they are already fixed at these values
+                if ax.get_autoscalex_on() or ax.get_xlim() != (start_limit, end_limit):
+                    ax.set_xlim(start_limit, end_limit)
 
                 # Add vertical grid lines at 1-hour intervals
                 if i == 0:  # Hour labels panel - extend grid lines to almost the bottom
@@ -85,12 +98,6 @@ class MeteogramGridManager(GridManager):
                     )
                 else:
                     # For all other panels, use full height grid lines
-                    # Get grid colors from configuration
-                    effective_colors = self.config.get_effective_colors()
-                    grid_color = effective_colors.get("grid", "#e0e0e0")
-                    colors_config = getattr(self.config, "colors", {}) or {}
-                    grid_alpha = colors_config.get("grid_alpha", 0.3)
-
                     FormattingUtils.add_vertical_grid(
                         ax,
                         data_length,
@@ -120,84 +127,43 @@ class MeteogramGridManager(GridManager):
             ax_main: Main parameters axis (temperature axis)
             data: Weather data DataFrame
         """
-        # Temperature grid (primary axis)
-        if "temperature" in data.columns:
-            temp_min, temp_max = ax_main.get_ylim()
-            # Use more grid lines for temperature to match reference density (approx 1 degree steps)
-            temp_grid: List[float] = FormattingUtils.calculate_nice_grid_values(
-                temp_min, temp_max, maximum_grid_lines=10
-            )
-            self._shared_grid_values["temperature"] = {
-                "values": temp_grid,
-                "axis_min": temp_min,
-                "axis_max": temp_max,
-                "axis": ax_main,
-            }
-
-        # Wind speed grid (if wind axis exists)
-        if (
-            "wind_speed" in data.columns
-            and hasattr(self, "_wind_axis")
-            and self._wind_axis is not None
-        ):
-            wind_min, wind_max = self._wind_axis.get_ylim()
-            # Wind speed usually in steps of 2 m/s
-            wind_grid: List[float] = FormattingUtils.calculate_nice_grid_values(
-                wind_min, wind_max, maximum_grid_lines=10
+        available_columns = set(data.columns)
+
+        # (variable, axis, drop negative values); temperature is the primary axis
+        grid_axes = (
+            ("temperature", ax_main, False),
+            ("wind_speed", self._wind_axis, False),
+            ("pressure", self._pressure_axis, False),
+            ("precipitation", self._precip_axis, True),
+        )
+
+        for variable, axis, non_negative in grid_axes:
+            if axis is None or variable not in available_columns:
+                continue
+
+            axis_min, axis_max = axis.get_ylim()
+            grid_values: List[float] = FormattingUtils.calculate_nice_grid_values(
+                axis_min, axis_max, maximum_grid_lines=10
             )
-            self._shared_grid_values["wind_speed"] = {
-                "values": wind_grid,
-                "axis_min": wind_min,
-                "axis_max": wind_max,
-                "axis": self._wind_axis,
-            }
-
-        # Pressure grid (if pressure axis exists)
-        if (
-            "pressure" in data.columns
-            and hasattr(self, "_pressure_axis")
-            and self._pressure_axis is not None
-        ):
-            pressure_min, pressure_max = self._pressure_axis.get_ylim()
-            # Pressure usually in steps of 5 or 10 hPa
-            pressure_grid: List[float] = FormattingUtils.calculate_nice_grid_values(
-                pressure_min, pressure_max, maximum_grid_lines=10
-            )
-            self._shared_grid_values["pressure"] = {
-                "values": pressure_grid,
-                "axis_min": pressure_min,
-                "axis_max": pressure_max,
-                "axis": self._pressure_axis,
-            }
-
-        # Precipitation grid (if precipitation axis exists)
-        if (
-            "precipitation" in data.columns
-            and hasattr(self, "_precip_axis")
-            and self._precip_axis is not None
-        ):
-            precip_min, precip_max = self._precip_axis.get_ylim()
-            # Precipitation usually in steps of 1 or 2 mm
-            precip_grid: List[float] = FormattingUtils.calculate_nice_grid_values(
-                precip_min, precip_max, maximum_grid_lines=10
-            )
-            # Filter out negative values for precipitation
-            precip_grid = [val for val in precip_grid if val >= 0]
-            self._shared_grid_values["precipitation"] = {
-                "values": precip_grid,
-                "axis_min": precip_min,
-                "axis_max": precip_max,
-                "axis": self._precip_axis,
+            if non_negative:
+                # Filter out negative values, e.g. for precipitation
+                grid_values = [val for val in grid_values if val >= 0]
+
+            self._shared_grid_values[variable] = {
+                "values": grid_values,
+                "axis_min": axis_min,
+                "axis_max": axis_max,
+                "axis": axis,
             }
 
         # Dew point uses the same axis as temperature
-        if "dew_point" in data.columns:
+        if "dew_point" in available_columns:
             self._shared_grid_values["dew_point"] = self._shared_grid_values.get(
                 "temperature", {}
             )
 
         # Humidity would use the same system if it exists
-        if "humidity" in data.columns:
+        if "humidity" in available_columns:
             # Humidity typically ranges 0-100%, so we can create a standard grid
             humidity_grid: List[float] = [0, 20, 40, 60, 80, 100]
             self._shared_grid_values["humidity"] = {
@@ -222,15 +188,9 @@ class MeteogramGridManager(GridManager):
             if "values" in temp_info and "axis" in temp_info:
                 temp_values: List[float] = temp_info["values"]
                 temp_axis = temp_info["axis"]
-                for temp_val in temp_values:
-                    temp_axis.axhline(
-                        y=temp_val,
-                        color=grid_color,
-                        linestyle="-",
-                        alpha=0.3,
-                        linewidth=0.5,
-                        zorder=0,
-                    )
+                self._add_horizontal_grid_lines(
+                    temp_axis, temp_values, grid_color, linestyle="-", alpha=0.3
+                )
 
         # Draw grid lines for other axes (lighter/dotted to distinguish)
         for var_name, var_info in self._shared_grid_values.items():
@@ -238,15 +198,49 @@ class MeteogramGridManager(GridManager):
                 if "values" in var_info:
                     var_values: List[float] = var_info["values"]
                     var_axis = var_info["axis"]
-                    for val in var_values:
-                        var_axis.axhline(
-                            y=val,
-                            color=grid_color,
-                            linestyle=":",
-                            alpha=0.2,
-                            linewidth=0.5,
-                            zorder=0,
-                        )
+                    self._add_horizontal_grid_lines(
+                        var_axis, var_values, grid_color, linestyle=":", alpha=0.2
+                    )
+
+    @staticmethod
+    def _add_horizontal_grid_lines(
+        ax: Axes,
+        y_values: List[float],
+        color: str,
+        linestyle: str,
+        alpha: float,
+    ) -> None:
+        """Draw full-width horizontal grid lines at data y values as one collection.
+
+        Args:
+            ax: matplotlib Axes object
+            y_values: Data y positions of the grid lines
+            color: Color of grid lines
+            linestyle: Line style for grid lines
+            alpha: Alpha transparency of grid lines
+        """
+        if not y_values:
+            return
+
+        ys = np.asarray(y_values, dtype=float)
+        segments = np.empty((ys.size, 2, 2))
+        segments[:, 0, 0] = 0.0
+        segments[:, 1, 0] = 1.0
+        segments[:, :, 1] = ys[:, None]
+
+        # x spans the axis width, y is in data coordinates
+        ax.add_collection(
+            LineCollection(
+                # An (N, 2, 2) array is accepted as a sequence of segments
+                cast(Sequence[np.ndarray], segments),
+                colors=color,
+                linestyles=linestyle,
+                alpha=alpha,
+                linewidths=0.5,
+                zorder=0,
+                transform=ax.get_yaxis_transform(),
+            )
+        )
 
     def detect_day_boundaries(self, data: pd.DataFrame) -> List[int]:
         """Detect indices where day boundaries occur in the data.
@@ -257,19 +251,22 @@ class MeteogramGridManager(GridManager):
         Returns:
             List of indices where day changes occur
         """
-        day_boundaries: List[int] = []
         if data.empty:
-            return day_boundaries
+            return []
 
-        current_date = None
-        for i, timestamp in enumerate(data.index):
-            date = timestamp.date()
-            if date != current_date:
-                current_date = date
-                if i > 0:  # Don't mark the first data point as a boundary
-                    day_boundaries.append(i)
+        if (
+            self._day_boundary_cache is not None
+            and self._day_boundary_cache[0] is data.index
+        ):
+            return list(self._day_boundary_cache[1])
 
-        return day_boundaries
+        # Compare midnight timestamps; the first data point is never a boundary
+        day_values = pd.DatetimeIndex(data.index).normalize().asi8
+        day_boundaries: List[int] = (
+            np.flatnonzero(np.diff(day_values) != 0) + 1
+        ).tolist()
+        self._day_boundary_cache = (data.index, day_boundaries)
+        return list(day_boundaries)
 
     def _add_custom_vertical_grid(
         self,
@@ -290,25 +287,48 @@ class MeteogramGridManager(GridManager):
         """
         day_boundaries = day_boundaries or []
 
-        if data_length > 0:
-            # Position grid lines at the center of each hour (0.5, 1.5, 2.5, etc.)
-            grid_positions = np.arange(0.5, data_length, self.grid_interval)
-            for pos in grid_positions:
-                if pos < data_length:
-                    # Check if this position is near a day boundary (within 0.5 of any boundary)
-                    is_day_boundary = any(
-                        abs(pos - boundary) < 0.5 for boundary in day_boundaries
-                    )
-                    linewidth = 1.5 if is_day_boundary else 0.5
-
-                    ax.plot(
-                        [pos, pos],
-                        [y_start, y_end],
-                        color="gray",
-                        linestyle="-",
-                        alpha=0.3,
-                        linewidth=linewidth,
-                    )
+        if data_length <= 0:
+            return
+
+        # Position grid lines at the center of each hour (0.5, 1.5, 2.5, etc.)
+        grid_positions = np.arange(0.5, data_length, self.grid_interval)
+        grid_positions = grid_positions[grid_positions < data_length]
+        if grid_positions.size == 0:
+            return
+
+        # Check if each position is near a day boundary (within 0.5 of any
+        # boundary); only the sorted neighbours on either side can be closest
+        boundary_positions = np.sort(np.asarray(day_boundaries, dtype=float))
+        if boundary_positions.size:
+            right = np.searchsorted(boundary_positions, grid_positions)
+            left = np.maximum(right - 1, 0)
+            right = np.minimum(right, boundary_positions.size - 1)
+            nearest_distance = np.minimum(
+                np.abs(grid_positions - boundary_positions[left]),
+                np.abs(grid_positions - boundary_positions[right]),
+            )
+            is_day_boundary = nearest_distance < 0.5
+        else:
+            is_day_boundary = np.zeros(grid_positions.size, dtype=bool)
+        line_widths = np.where(is_day_boundary, 1.5, 0.5)
+
+        # One segment per position, all drawn as a single collection
+        segments = np.empty((grid_positions.size, 2, 2))
+        segments[:, :, 0] = grid_positions[:, None]
+        segments[:, 0, 1] = y_start
+        segments[:, 1, 1] = y_end
+
+        ax.add_collection(
+            LineCollection(
+                # An (N, 2, 2) array is accepted as a sequence of segments
+                cast(Sequence[np.ndarray], segments),
+                colors="gray",
+                linestyles="solid",
+                alpha=0.3,
+                linewidths=line_widths,
+                capstyle="projecting",
+            )
+        )
 
     def get_shared_grid_values(self) -> Dict[str, Dict[str, Any]]:
         """Get shared grid values for legend positioning.
@@ -4,14 +4,58 @@ Icon management for weather symbols.
 This module handles downloading, caching, and managing SVG icons from the Met.no repository.
 """
 
+import asyncio
 import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Concurrent icon downloads; each one is a small, latency-bound HTTP request
+_MAX_DOWNLOAD_WORKERS = 16
+
+# Chunk size used when streaming icon downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Shared HTTP session so icon downloads reuse keep-alive connections to Met.no
+_SESSION = requests.Session()
+_SESSION_ADAPTER = HTTPAdapter(
+    pool_connections=_MAX_DOWNLOAD_WORKERS, pool_maxsize=_MAX_DOWNLOAD_WORKERS
+)
+_SESSION.mount("http://", _SESSION_ADAPTER)
+_SESSION.mount("https://", _SESSION_ADAPTER)
+
+
+def _import_aiohttp() -> Optional[Any]:
+    """Import aiohttp if it is installed.
+
+    aiohttp is an optional dependency; without it icons are downloaded on a
+    thread pool instead.
+
+    Returns:
+        The aiohttp module, or None if it is not available
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    return aiohttp
+
+
+def _in_event_loop() -> bool:
+    """Check whether the caller is already running inside an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
 
 class IconManager:
     """Manages SVG icon downloading and caching."""
@@ -25,6 +69,31 @@ class IconManager:
         """
         self.cache_dir = cache_dir
         self.base_url = base_url
+        # Resolved icon paths per symbol code, cleared when a new icon is cached
+        self._icon_path_cache: Dict[str, Optional[Path]] = {}
+        # SVG file names in the cache directory, read on first lookup
+        self._svg_names: Optional[Set[str]] = None
+
+    def _get_svg_names(self) -> Set[str]:
+        """Get the names of the SVG files in the cache directory.
+
+        The directory is read once; icons downloaded afterwards are added as
+        they are cached.
+
+        Returns:
+            Set of SVG file names
+        """
+        if self._svg_names is None:
+            svg_names: Set[str] = set()
+            try:
+                with os.scandir(self.cache_dir) as entries:
+                    svg_names.update(
+                        entry.name for entry in entries if entry.name.endswith(".svg")
+                    )
+            except OSError:
+                pass
+            self._svg_names = svg_names
+        return self._svg_names
 
     def get_icon_path(self, symbol_code: Any) -> Optional[Path]:
         """Get the path to an SVG icon file.
@@ -41,31 +110,40 @@ class IconManager:
         # Convert to string if it's an integer
         symbol_code = str(symbol_code)
 
-        # Clean symbol code (remove any _d or _n suffixes for day/night variants)
-        base_symbol = symbol_code.replace("_d", "").replace("_n", "")
+        if symbol_code in self._icon_path_cache:
+            return self._icon_path_cache[symbol_code]
 
-        # Try exact match first
-        svg_path = self.cache_dir / f"{symbol_code}.svg"
-        if svg_path.exists():
-            return svg_path
+        icon_path = self._resolve_icon_path(symbol_code)
+        self._icon_path_cache[symbol_code] = icon_path
+        return icon_path
 
-        # Try base symbol without day/night suffix
-        svg_path = self.cache_dir / f"{base_symbol}.svg"
-        if svg_path.exists():
-            return svg_path
+    def _resolve_icon_path(self, symbol_code: str) -> Optional[Path]:
+        """Find the cached SVG file for a symbol code.
+
+        Args:
+            symbol_code: Weather symbol code
+
+        Returns:
+            Path to SVG file or None if not found
+        """
+        # Clean symbol code (remove any _d or _n suffixes for day/night variants)
+        base_symbol = symbol_code.replace("_d", "").replace("_n", "")
 
-        # Try common variations
-        variations = [
+        # Exact match first, then the base symbol without day/night suffix,
+        # then common variations
+        candidates = (
+            f"{symbol_code}.svg",
+            f"{base_symbol}.svg",
             f"{symbol_code}_day.svg",
             f"{symbol_code}_night.svg",
             f"{base_symbol}_day.svg",
             f"{base_symbol}_night.svg",
-        ]
+        )
 
-        for variation in variations:
-            svg_path = self.cache_dir / variation
-            if svg_path.exists():
-                return svg_path
+        svg_names = self._get_svg_names()
+        for candidate in candidates:
+            if candidate in svg_names:
+                return self.cache_dir / candidate
 
         return None
 
@@ -84,19 +162,20 @@ class IconManager:
         # Set up cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Check if already cached
+        # Check if already cached (possibly by another IconManager)
         icon_path = self.cache_dir / svg_filename
         if icon_path.exists():
+            self._remember_icon(svg_filename)
             return icon_path
 
         # Download from official Met.no repository
         try:
             url = self.base_url + svg_filename
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            with open(icon_path, "wb") as f:
-                f.write(response.content)
+            with _SESSION.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                self._store_icon(
+                    svg_filename, response.iter_content(_DOWNLOAD_CHUNK_SIZE)
+                )
 
             logger.debug("Downloaded Met.no weather icon: %s", svg_filename)
             return icon_path
@@ -107,6 +186,52 @@ class IconManager:
             )
             return None
 
+    def _store_icon(self, svg_filename: str, chunks: Iterable[bytes]) -> Path:
+        """Write downloaded icon data into the cache directory.
+
+        The data is written to a temporary file and moved into place, so an
+        interrupted download never leaves a partial icon in the cache.
+
+        Args:
+            svg_filename: Name of the SVG icon file
+            chunks: Icon file content
+
+        Returns:
+            Path to the cached icon
+        """
+        icon_path = self.cache_dir / svg_filename
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=self.cache_dir, prefix=f".{svg_filename}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(temp_fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(temp_path, icon_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        self._remember_icon(svg_filename)
+        return icon_path
+
+    def _remember_icon(self, svg_filename: str) -> None:
+        """Record an icon file that is present in the cache directory.
+
+        Args:
+            svg_filename: Name of the SVG icon file
+        """
+        if self._svg_names is not None:
+            if svg_filename in self._svg_names:
+                return
+            self._svg_names.add(svg_filename)
+
+        # A new icon may resolve symbol codes that previously had none
+        self._icon_path_cache.clear()
+
     def download_all_icons(
         self, symbol_mapping: Dict[str, Dict[str, Any]]
     ) -> Dict[str, bool]:
@@ -118,15 +243,11 @@ class IconManager:
         Returns:
             Dictionary mapping icon names to download success status
         """
-        results = {}
-
         logger.info("Downloading all Met.no weather icons...")
 
-        for symbol_info in symbol_mapping.values():
-            svg_filename = symbol_info.get("svg")
-            if svg_filename:
-                icon_path = self.download_svg_icon(svg_filename)
-                results[svg_filename] = icon_path is not None
+        results = self._download_icons(
+            symbol_info.get("svg") for symbol_info in symbol_mapping.values()
+        )
 
         successful = sum(results.values())
         total = len(results)
@@ -160,18 +281,89 @@ class IconManager:
             "snowshowers_day.svg",
         ]
 
-        missing_icons = []
-        for icon in essential_icons:
-            icon_path = self.cache_dir / icon
-            if not icon_path.exists():
-                missing_icons.append(icon)
+        svg_names = self._get_svg_names()
+        missing_icons = [icon for icon in essential_icons if icon not in svg_names]
 
         if missing_icons:
             logger.info(
                 "Downloading %d essential Met.no weather icons...", len(missing_icons)
             )
-            for icon in missing_icons:
-                self.download_svg_icon(icon)
+            self._download_icons(missing_icons)
+
+    def _download_icons(
+        self, svg_filenames: Iterable[Optional[str]]
+    ) -> Dict[str, bool]:
+        """Download several SVG icons concurrently.
+
+        Args:
+            svg_filenames: Icon file names; empty names and duplicates are skipped
+
+        Returns:
+            Dictionary mapping icon names to download success status
+        """
+        # Several symbols share an icon; download each file only once
+        unique_filenames = list(dict.fromkeys(name for name in svg_filenames if name))
+        if not unique_filenames:
+            return {}
+
+        # asyncio.run cannot be nested, so callers inside an event loop use threads
+        aiohttp = _import_aiohttp()
+        if aiohttp is not None and not _in_event_loop():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            return asyncio.run(self._download_icons_async(aiohttp, unique_filenames))
+
+        max_workers = min(_MAX_DOWNLOAD_WORKERS, len(unique_filenames))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            icon_paths = executor.map(self.download_svg_icon, unique_filenames)
+            return {
+                svg_filename: icon_path is not None
+                for svg_filename, icon_path in zip(unique_filenames, icon_paths)
+            }
+
+    async def _download_icons_async(
+        self, aiohttp: Any, svg_filenames: List[str]
+    ) -> Dict[str, bool]:
+        """Download several SVG icons concurrently on one event loop.
+
+        Args:
+            aiohttp: The aiohttp module
+            svg_filenames: Unique, non-empty icon file names
+
+        Returns:
+            Dictionary mapping icon names to download success status
+        """
+        # Bound the number of requests in flight to go easy on Met.no
+        semaphore = asyncio.Semaphore(_MAX_DOWNLOAD_WORKERS)
+        timeout = aiohttp.ClientTimeout(total=10)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+
+            async def download(svg_filename: str) -> bool:
+                if (self.cache_dir / svg_filename).exists():
+                    self._remember_icon(svg_filename)
+                    return True
+
+                try:
+                    async with semaphore:
+                        url = self.base_url + svg_filename
+                        async with session.get(url) as response:
+                            response.raise_for_status()
+                            content = await response.read()
+                    # Icons are a few kilobytes; writing them inline is cheaper
+                    # than handing each one to a worker thread
+                    self._store_icon(svg_filename, (content,))
+                except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                    logger.warning(
+                        "Failed to download Met.no weather icon %s: %s", svg_filename, e
+                    )
+                    return False
+
+                logger.debug("Downloaded Met.no weather icon: %s", svg_filename)
+                return True
+
+            successes = await asyncio.gather(*map(download, svg_filenames))
+
+        return dict(zip(svg_filenames, successes))
 
     def get_icon_statistics(self) -> Dict[str, Any]:
         """Get statistics about cached icons.
@@ -182,11 +374,17 @@ class IconManager:
         if not self.cache_dir.exists():
             return {"total_icons": 0, "cache_size_mb": 0}
 
-        svg_files = list(self.cache_dir.glob("*.svg"))
-        total_size = sum(f.stat().st_size for f in svg_files)
+        # One directory read; DirEntry reuses the type info it already has
+        icon_count = 0
+        total_size = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".svg") and entry.is_file():
+                    icon_count += 1
+                    total_size += entry.stat().st_size
 
         return {
-            "total_icons": len(svg_files),
+            "total_icons": icon_count,
             "cache_size_mb": round(total_size / (1024 * 1024), 2),
             "cache_directory": str(self.cache_dir),
         }
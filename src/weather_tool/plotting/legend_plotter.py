@@ -7,10 +7,10 @@ This module provides legend plotting functionality following the Single Responsi
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 
 from .interfaces import PlotConfig
 from .legend_interfaces import SideLegendPlotter
@@ -116,9 +116,8 @@ class MeteogramLegendPlotter(SideLegendPlotter):
             data: Weather data DataFrame
             label_padding: LabelPaddingConfig for custom positioning
         """
+        # The axis position follows from the GridSpec, so no draw is needed
         fig = ax.get_figure()
-        if fig is not None:
-            fig.canvas.draw()  # Force drawing to get final positions
         bbox = ax.get_position()
 
         # Get positioning configuration
@@ -138,7 +137,7 @@ class MeteogramLegendPlotter(SideLegendPlotter):
                 # Draw line from bottom of plot area to top of plot area
                 # Axis bbox height is relative to figure, so we use that
                 fig.add_artist(
-                    plt.Line2D(
+                    Line2D(
                         [separator_x, separator_x],
                         [bbox.y0, bbox.y0 + bbox.height],
                         color="black",
@@ -304,9 +303,8 @@ class MeteogramLegendPlotter(SideLegendPlotter):
             data: Weather data DataFrame
             label_padding: LabelPaddingConfig for custom positioning
         """
+        # The axis position follows from the GridSpec, so no draw is needed
         fig = ax.get_figure()
-        if fig is not None:
-            fig.canvas.draw()  # Force drawing to get final positions
         bbox = ax.get_position()
 
         # Get positioning configuration
@@ -325,7 +323,7 @@ class MeteogramLegendPlotter(SideLegendPlotter):
                 separator_x = precip_x - (precip_x - pressure_x) / 2
                 # Draw line from bottom of plot area to top of plot area
                 fig.add_artist(
-                    plt.Line2D(
+                    Line2D(
                         [separator_x, separator_x],
                         [bbox.y0, bbox.y0 + bbox.height],
                         color="black",
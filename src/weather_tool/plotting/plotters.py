@@ -8,9 +8,9 @@ now using composition and delegation to follow SOLID principles.
 import logging
 from typing import Any, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 
 from .components import (
     BottomLegendPlotter,
@@ -65,20 +65,21 @@ class MeteogramPlotter(WeatherPlotter):
             "wind_section": 1.2,  # Wind barbs and wind information
         }
 
-        # Convert to list for matplotlib gridspec (maintains order)
+        # Panel order for matplotlib gridspec
         # New order: 1) Cloud coverage (as is), 2) Weather symbols, 3) Main diagram, 4) Wind at bottom
-        self.height_ratios = [
-            self.panel_heights["hour_labels"],
-            self.panel_heights["cloud_high"],
-            self.panel_heights["cloud_medium"],
-            self.panel_heights["cloud_low"],
-            self.panel_heights["fog"],
-            self.panel_heights["separator"],
-            self.panel_heights["weather_symbols"],
-            self.panel_heights["main_params"],
-            self.panel_heights["time_axis"],
-            self.panel_heights["wind_section"],
+        self.panel_order = [
+            "hour_labels",
+            "cloud_high",
+            "cloud_medium",
+            "cloud_low",
+            "fog",
+            "separator",
+            "weather_symbols",
+            "main_params",
+            "time_axis",
+            "wind_section",
         ]
+        self.height_ratios = [self.panel_heights[name] for name in self.panel_order]
 
     def create_plot(
         self,
@@ -236,7 +237,7 @@ class MeteogramPlotter(WeatherPlotter):
         ]
         
         # Add figure bounding box
-        rect = plt.Rectangle(
+        rect = Rectangle(
             (0, 0), 1, 1, 
             transform=fig.transFigure, 
             facecolor="none", 
@@ -286,8 +286,10 @@ class WeatherSymbolMapping:
         if symbol_data.empty:
             return {"total_symbols": 0, "unique_symbols": 0, "symbol_counts": {}}
 
-        # Count occurrences
-        symbol_counts = symbol_data.value_counts().to_dict()
+        # Count occurrences (categorical data also lists unused categories)
+        symbol_counts = {
+            code: count for code, count in symbol_data.value_counts().items() if count
+        }
 
         # Get descriptions
         symbol_descriptions = {}
@@ -0,0 +1,70 @@
+"""
+Tests for the derived weather variable kernels.
+"""
+
+import numpy as np
+import pytest
+
+from weather_tool.data import _derived_kernels
+from weather_tool.data._derived_kernels import _compute_derived_numpy
+
+
+class TestComputeDerivedNumpy:
+    """Dew point tests for the vectorized derived-variable fallback."""
+
+    @staticmethod
+    def _magnus_dew_point(temp: np.ndarray, rh: np.ndarray) -> np.ndarray:
+        """Evaluate the Magnus formula with plain NumPy in double precision."""
+        a, b = 17.27, 237.7
+        alpha = (a * temp) / (b + temp) + np.log(rh / 100.0)
+        return np.asarray((b * alpha) / (a - alpha))
+
+    def test_numpy_dew_point_stays_float32(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the NumPy fallback matches the formula without upcasting."""
+        monkeypatch.setattr(_derived_kernels, "numexpr", None)
+        temp = np.array([-10.0, 0.0, 12.5, 30.0], dtype=np.float32)
+        rh = np.array([95.0, 80.0, 55.0, 40.0], dtype=np.float32)
+        out_dp = np.full_like(temp, np.nan)
+
+        _compute_derived_numpy(
+            temp,
+            temp,
+            rh,
+            np.empty_like(temp),
+            np.empty_like(temp),
+            out_dp,
+            False,
+            False,
+            True,
+        )
+
+        assert out_dp.dtype == np.float32
+        expected = self._magnus_dew_point(temp.astype(np.float64), rh)
+        np.testing.assert_allclose(out_dp, expected, rtol=1e-5, atol=1e-4)
+
+    def test_numexpr_dew_point_matches_numpy(self) -> None:
+        """Test the numexpr expression fills float32 output like NumPy would."""
+        pytest.importorskip("numexpr")
+        assert _derived_kernels.numexpr is not None
+
+        temp = np.array([-10.0, 0.0, 12.5, 30.0, np.nan], dtype=np.float32)
+        rh = np.array([95.0, 80.0, 55.0, 40.0, 50.0], dtype=np.float32)
+        out_dp = np.full_like(temp, np.nan)
+
+        _compute_derived_numpy(
+            temp,
+            temp,
+            rh,
+            np.empty_like(temp),
+            np.empty_like(temp),
+            out_dp,
+            False,
+            False,
+            True,
+        )
+
+        assert out_dp.dtype == np.float32
+        expected = self._magnus_dew_point(temp.astype(np.float64), rh)
+        np.testing.assert_allclose(out_dp, expected, rtol=1e-5, atol=1e-4)
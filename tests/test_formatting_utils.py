@@ -0,0 +1,111 @@
+"""
+Tests for the meteogram formatting helpers.
+"""
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from weather_tool.plotting.components import FormattingUtils
+
+
+class TestCalculateNiceGridValues:
+    """Grid value tests for FormattingUtils.calculate_nice_grid_values."""
+
+    def test_rounds_to_nice_steps(self) -> None:
+        """Test values use a 1/2/5 step and stay within the range."""
+        values = FormattingUtils.calculate_nice_grid_values(-3.2, 7.9, 6)
+
+        assert values == [-2, 0, 2, 4, 6]
+
+    def test_includes_range_end_for_fractional_steps(self) -> None:
+        """Test fractional steps do not drift past the upper limit."""
+        values = FormattingUtils.calculate_nice_grid_values(985, 987, 10)
+
+        assert len(values) == 11
+        assert values[0] == 985
+        assert values[-1] == pytest.approx(987)
+
+    def test_empty_range(self) -> None:
+        """Test a zero-width range yields no grid lines."""
+        assert FormattingUtils.calculate_nice_grid_values(5, 5) == []
+
+    def test_returns_independent_lists(self) -> None:
+        """Test callers can modify the result without affecting the cache."""
+        values = FormattingUtils.calculate_nice_grid_values(0, 10, 5)
+        values.clear()
+
+        assert FormattingUtils.calculate_nice_grid_values(0, 10, 5) == [
+            0,
+            2,
+            4,
+            6,
+            8,
+            10,
+        ]
+
+
+class TestCalculatePaddedXlim:
+    """Axis limit tests for FormattingUtils.calculate_padded_xlim."""
+
+    @pytest.fixture
+    def data(self) -> pd.DataFrame:
+        """Create half-hourly data with eleven points."""
+        return pd.DataFrame(
+            {"temperature": range(11)},
+            index=pd.date_range("2024-01-15", periods=11, freq="30min"),
+        )
+
+    def test_fractional_padding(self, data: pd.DataFrame) -> None:
+        """Test fractional padding scales with the number of intervals."""
+        limits = FormattingUtils.calculate_padded_xlim(
+            data, {"start_padding": 0.1, "end_padding": 0.2}
+        )
+
+        assert limits == pytest.approx((-1.0, 12.0))
+
+    def test_hour_padding_uses_time_resolution(self, data: pd.DataFrame) -> None:
+        """Test hour-based padding is converted to data points."""
+        limits = FormattingUtils.calculate_padded_xlim(
+            data, {"start_padding_hours": 1, "end_padding": 0.0}
+        )
+
+        assert limits == pytest.approx((-2.0, 10.0))
+
+    def test_empty_data(self) -> None:
+        """Test empty data falls back to a unit range."""
+        assert FormattingUtils.calculate_padded_xlim(pd.DataFrame(), {}) == (0, 1)
+
+
+class TestApplyNorwegianStyling:
+    """Styling tests for FormattingUtils.apply_norwegian_styling."""
+
+    def test_styles_each_axis_once(self) -> None:
+        """Test repeat calls only update the label."""
+        fig, ax = plt.subplots()
+        FormattingUtils.apply_norwegian_styling(ax, "Temperature")
+        ax.spines["top"].set_visible(True)
+
+        FormattingUtils.apply_norwegian_styling(ax, "Pressure")
+
+        assert ax.get_ylabel() == "Pressure"
+        assert ax.spines["top"].get_visible()
+        plt.close(fig)
+
+    def test_restyles_cleared_and_recreated_axes(self) -> None:
+        """Test clearing or recreating an axis applies the styling again."""
+        fig, ax = plt.subplots()
+        FormattingUtils.apply_norwegian_styling(ax)
+        ax.clear()
+        ax.spines["top"].set_visible(True)
+
+        FormattingUtils.apply_norwegian_styling(ax)
+
+        assert not ax.spines["top"].get_visible()
+
+        fig.clear()
+        new_ax = fig.add_subplot()
+        FormattingUtils.apply_norwegian_styling(new_ax)
+
+        assert not new_ax.spines["top"].get_visible()
+        plt.close(fig)
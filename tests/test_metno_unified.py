@@ -0,0 +1,118 @@
+"""
+Tests for the Met.no locationforecast response parser.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from weather_tool.data.metno_unified import MetNoFileClient, MetNoHTTPClient
+
+
+class TestParseMetnoJson:
+    """Parsing tests for MetNoHTTPClient._parse_metno_json."""
+
+    @pytest.fixture
+    def response(self) -> Dict[str, Any]:
+        """Create a minimal locationforecast payload (newest entry first)."""
+        return {
+            "properties": {
+                "timeseries": [
+                    {
+                        "time": "2024-01-15T02:00:00Z",
+                        "data": {"instant": {"details": {"air_temperature": 1.5}}},
+                    },
+                    {
+                        "time": "2024-01-15T01:00:00Z",
+                        "data": {
+                            "instant": {"details": {"air_temperature": 1.0}},
+                            "next_6_hours": {
+                                "summary": {"symbol_code": "cloudy"},
+                                "details": {"precipitation_amount": 3.0},
+                            },
+                        },
+                    },
+                    {
+                        "time": "2024-01-15T00:00:00Z",
+                        "data": {
+                            "instant": {"details": {"air_temperature": 0.5}},
+                            "next_1_hours": {
+                                "summary": {"symbol_code": "rain"},
+                                "details": {"precipitation_amount": 0.4},
+                            },
+                            "next_6_hours": {
+                                "summary": {"symbol_code": "cloudy"},
+                                "details": {"precipitation_amount": 2.0},
+                            },
+                        },
+                    },
+                ]
+            }
+        }
+
+    def test_parses_periods_in_time_order(self, response: Dict[str, Any]) -> None:
+        """Test next_1_hours is preferred over next_6_hours and rows are sorted."""
+        df = MetNoHTTPClient._parse_metno_json(
+            MetNoHTTPClient,
+            response,
+            datetime(2024, 1, 15, 0, tzinfo=timezone.utc),
+            datetime(2024, 1, 15, 6, tzinfo=timezone.utc),
+        )
+
+        assert list(df.index.hour) == [0, 1, 2]
+        np.testing.assert_allclose(df["air_temperature_2m"], [0.5, 1.0, 1.5])
+        np.testing.assert_allclose(df["precipitation_amount"], [0.4, 3.0, 0.0])
+        assert isinstance(df["symbol_code"].dtype, pd.CategoricalDtype)
+        assert list(df["symbol_code"].iloc[:2]) == ["rain", "cloudy"]
+        assert pd.isna(df["symbol_code"].iloc[2])
+
+    def test_filters_time_range(self, response: Dict[str, Any]) -> None:
+        """Test entries outside the requested window are dropped."""
+        df = MetNoHTTPClient._parse_metno_json(
+            MetNoHTTPClient,
+            response,
+            datetime(2024, 1, 15, 1),
+            datetime(2024, 1, 15, 1),
+        )
+
+        np.testing.assert_allclose(df["air_temperature_2m"], [1.0])
+
+        with pytest.raises(ValueError):
+            MetNoHTTPClient._parse_metno_json(
+                MetNoHTTPClient,
+                response,
+                datetime(2024, 1, 16),
+                datetime(2024, 1, 17),
+            )
+
+
+class TestCleanDataframe:
+    """Index tests for MetNoFileClient._clean_dataframe."""
+
+    @pytest.fixture
+    def times(self) -> pd.DatetimeIndex:
+        """Create three hourly timestamps."""
+        return pd.date_range("2024-01-15", periods=3, freq="h", name="time")
+
+    def test_time_column_becomes_index(self, times: pd.DatetimeIndex) -> None:
+        """Test a frame with time as a plain column is indexed by time."""
+        df = pd.DataFrame({"time": times, "air_temperature_2m": [0.5, 1.0, 1.5]})
+
+        cleaned = MetNoFileClient._clean_dataframe(MetNoFileClient, df)
+
+        assert cleaned.index.name == "time"
+        assert "time" not in cleaned.columns
+        np.testing.assert_allclose(cleaned["air_temperature_2m"], [0.5, 1.0, 1.5])
+
+    def test_extra_index_levels_become_columns(self, times: pd.DatetimeIndex) -> None:
+        """Test only time is kept as the index of a multi-level frame."""
+        index = pd.MultiIndex.from_arrays([times, [0, 0, 0]], names=["time", "height"])
+        df = pd.DataFrame({"air_temperature_2m": [0.5, 1.0, 1.5]}, index=index)
+
+        cleaned = MetNoFileClient._clean_dataframe(MetNoFileClient, df)
+
+        assert list(cleaned.index.names) == ["time"]
+        assert list(cleaned["height"]) == [0, 0, 0]
@@ -0,0 +1,215 @@
+"""
+Tests for the shared weather data client caching, batching and registry logic.
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from weather_tool.data import interfaces
+from weather_tool.data.interfaces import (
+    DataClientRegistry,
+    DataSourceInfo,
+    DataSourceType,
+    WeatherDataClient,
+)
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start the clock at an arbitrary non-zero time."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+class FakeClient(WeatherDataClient):
+    """Client returning hourly data and recording every fetch and probe."""
+
+    def __init__(self, available: bool = True) -> None:
+        """Initialize the client with a fixed connection test result."""
+        super().__init__(None)
+        self.available = available
+        self.calls: List[Tuple[datetime, datetime]] = []
+        self.probes = 0
+
+    def get_weather_data(
+        self,
+        latitude: float,
+        longitude: float,
+        start_time: datetime,
+        end_time: datetime,
+        variables: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Return one row per hour between start_time and end_time."""
+        self.calls.append((start_time, end_time))
+        index = pd.date_range(start_time, end_time, freq="h")
+        return pd.DataFrame(
+            {"temperature": np.arange(len(index), dtype=np.float32)}, index=index
+        )
+
+    def test_connection(self) -> bool:
+        """Report the configured availability."""
+        self.probes += 1
+        return self.available
+
+    def get_source_info(self) -> DataSourceInfo:
+        """Describe a source that updates hourly."""
+        return DataSourceInfo(
+            name="Fake source",
+            source_type=DataSourceType.HTTP_API,
+            update_frequency="1H",
+        )
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the clock used by the data interfaces module."""
+    fake = FakeClock()
+    monkeypatch.setattr(interfaces, "time", fake)
+    return fake
+
+
+def _query(client: FakeClient, start_hour: int, end_hour: int) -> pd.DataFrame:
+    """Run a cached query for an hour window on 2024-01-15."""
+    return client.get_weather_data_cached(
+        59.91,
+        10.75,
+        datetime(2024, 1, 15, start_hour),
+        datetime(2024, 1, 15, end_hour),
+    )
+
+
+class TestGetWeatherDataCached:
+    """Cache tests for WeatherDataClient.get_weather_data_cached."""
+
+    def test_reuses_result_until_ttl_expires(self, clock: FakeClock) -> None:
+        """Test repeated queries hit the cache until the update frequency passes."""
+        client = FakeClient()
+
+        _query(client, 0, 6)
+        clock.now += 3599
+        _query(client, 0, 6)
+        assert len(client.calls) == 1
+
+        clock.now += 1
+        _query(client, 0, 6)
+        assert len(client.calls) == 2
+
+    def test_evicts_least_recently_used(self, clock: FakeClock) -> None:
+        """Test the oldest unused query is dropped once the cache is full."""
+        client = FakeClient()
+        client.cache_max_size = 2
+
+        _query(client, 0, 1)
+        _query(client, 0, 2)
+        _query(client, 0, 1)  # cache hit, now the most recently used
+        _query(client, 0, 3)  # evicts the 0-2 query
+        assert len(client.calls) == 3
+
+        _query(client, 0, 1)
+        assert len(client.calls) == 3
+
+        _query(client, 0, 2)
+        assert len(client.calls) == 4
+
+    def test_returns_independent_copies(self, clock: FakeClock) -> None:
+        """Test modifying a returned frame does not change the cached one."""
+        client = FakeClient()
+
+        first = _query(client, 0, 6)
+        first.iloc[0, 0] = 99.0
+        second = _query(client, 0, 6)
+
+        assert len(client.calls) == 1
+        assert second.iloc[0, 0] == 0.0
+
+    def test_copy_cached_is_independent(self) -> None:
+        """Test _copy_cached never shares writable data with the cache."""
+        cached = pd.DataFrame({"temperature": [1.0, 2.0]})
+
+        copy = WeatherDataClient._copy_cached(cached)
+        copy.iloc[0, 0] = 99.0
+
+        assert copy is not cached
+        assert cached.iloc[0, 0] == 1.0
+
+
+class TestGetWeatherDataBatch:
+    """Window merging tests for WeatherDataClient.get_weather_data_batch."""
+
+    def test_merges_overlapping_windows_in_order(self) -> None:
+        """Test overlapping windows are fetched once and sliced per query."""
+        client = FakeClient()
+        day = datetime(2024, 1, 15)
+        queries: List[Tuple[Any, ...]] = [
+            (59.91, 10.75, day.replace(hour=10), day.replace(hour=12)),
+            (59.91, 10.75, day.replace(hour=0), day.replace(hour=3)),
+            (59.91, 10.75, day.replace(hour=2), day.replace(hour=6)),
+            (59.91, 10.75, day.replace(hour=3), day.replace(hour=4)),
+            (59.912, 10.751, day.replace(hour=11), day.replace(hour=13)),
+            (60.39, 5.32, day.replace(hour=0), day.replace(hour=1)),
+        ]
+
+        results = client.get_weather_data_batch(queries)
+
+        # Start-sorted sweep: 0-3 + 2-6 (+ contained 3-4), 10-12 + 11-13, Bergen
+        assert client.calls == [
+            (day.replace(hour=0), day.replace(hour=6)),
+            (day.replace(hour=10), day.replace(hour=13)),
+            (day.replace(hour=0), day.replace(hour=1)),
+        ]
+        assert len(results) == len(queries)
+        for query, result in zip(queries, results):
+            assert result.index[0] == query[2]
+            assert result.index[-1] == query[3]
+
+
+class TestDataClientRegistry:
+    """Health check tests for DataClientRegistry.get_best_client."""
+
+    def test_skips_failing_client_until_backoff_expires(self, clock: FakeClock) -> None:
+        """Test a failing client is not re-probed before its backoff ends."""
+        registry = DataClientRegistry()
+        primary = FakeClient(available=False)
+        fallback = FakeClient()
+        registry.register_client("primary", primary, priority=10)
+        registry.register_client("fallback", fallback)
+
+        assert registry.get_best_client() is fallback
+        assert primary.probes == 1
+
+        primary.available = True
+        clock.now += registry.health_backoff_min - 1
+        assert registry.get_best_client() is fallback
+        assert primary.probes == 1
+
+        clock.now += 1
+        assert registry.get_best_client() is primary
+        assert primary.probes == 2
+
+    def test_backoff_doubles_after_repeated_failures(self, clock: FakeClock) -> None:
+        """Test each failed re-probe doubles the wait before the next one."""
+        registry = DataClientRegistry()
+        client = FakeClient(available=False)
+        registry.register_client("primary", client)
+
+        registry.get_best_client()
+        clock.now += registry.health_backoff_min
+        assert registry.get_best_client() is None
+        assert client.probes == 2
+
+        clock.now += registry.health_backoff_min
+        registry.get_best_client()
+        assert client.probes == 2
+
+        clock.now += registry.health_backoff_min
+        registry.get_best_client()
+        assert client.probes == 3
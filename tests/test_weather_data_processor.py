@@ -0,0 +1,116 @@
+"""
+Tests for the weather data standardization pipeline.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from weather_tool.data.interfaces import WeatherDataProcessor
+
+
+class TestConvertUnits:
+    """Unit conversion tests for WeatherDataProcessor."""
+
+    @pytest.fixture
+    def raw_data(self) -> pd.DataFrame:
+        """Create raw data in source units (Kelvin, Pa, percent)."""
+        return pd.DataFrame(
+            {
+                "temperature": [280.0, 290.0, np.nan],
+                "pressure": [101300.0, 101000.0, np.nan],
+                "precipitation": [-1.0, 0.0, 2.0],
+                "cloud_low": [50.0, 100.0, np.nan],
+                "fog": [0.2, 0.5, 0.9],
+            },
+            index=pd.date_range("2024-01-15", periods=3, freq="1h"),
+        )
+
+    def test_converts_source_units(self, raw_data: pd.DataFrame) -> None:
+        """Test Kelvin, Pa and percentage inputs are converted."""
+        converted = WeatherDataProcessor._convert_units(raw_data)
+
+        np.testing.assert_allclose(
+            converted["temperature"], [6.85, 16.85, np.nan], rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            converted["pressure"], [1013.0, 1010.0, np.nan], rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            converted["precipitation"], [0.0, 0.0, 2.0], rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            converted["cloud_low"], [0.5, 1.0, np.nan], rtol=1e-5
+        )
+        np.testing.assert_allclose(converted["fog"], [0.2, 0.5, 0.9], rtol=1e-5)
+
+    def test_does_not_modify_input(self, raw_data: pd.DataFrame) -> None:
+        """Test the caller's DataFrame is left untouched."""
+        original = raw_data.copy()
+
+        WeatherDataProcessor._convert_units(raw_data)
+
+        pd.testing.assert_frame_equal(raw_data, original)
+
+    def test_keeps_standard_units(self) -> None:
+        """Test data already in standard units is not rescaled."""
+        data = pd.DataFrame({"temperature": [-5.0, 12.0], "pressure": [1001.0, 1020.0]})
+
+        converted = WeatherDataProcessor._convert_units(data)
+
+        np.testing.assert_allclose(converted["temperature"], [-5.0, 12.0], rtol=1e-5)
+        np.testing.assert_allclose(converted["pressure"], [1001.0, 1020.0], rtol=1e-5)
+
+
+class TestStandardizeDataframe:
+    """Column mapping tests for WeatherDataProcessor."""
+
+    def test_maps_source_columns(self) -> None:
+        """Test source-specific names map to standardized variables."""
+        raw = pd.DataFrame(
+            {
+                "temp": [100.0, 200.0],
+                "air_temperature_2m": [1.0, 2.0],
+                "relative_humidity_2m": [50.0, 60.0],
+                "symbol_code": ["cloudy", "rain"],
+            },
+            index=pd.date_range("2024-01-15", periods=2, freq="1h"),
+        )
+
+        standardized = WeatherDataProcessor.standardize_dataframe(raw, None)
+
+        # The most preferred source name wins regardless of column order
+        np.testing.assert_allclose(standardized["temperature"], [1.0, 2.0], rtol=1e-5)
+        np.testing.assert_allclose(standardized["humidity"], [50.0, 60.0], rtol=1e-5)
+        assert list(standardized["weather_symbol"]) == ["cloudy", "rain"]
+        assert "dew_point" in standardized.columns
+
+    def test_numeric_columns_are_float32(self) -> None:
+        """Test measurements are stored in single precision."""
+        raw = pd.DataFrame(
+            {"air_temperature_2m": [1.0, 2.0], "wind_speed_10m": [3, 4]},
+            index=pd.date_range("2024-01-15", periods=2, freq="1h"),
+        )
+
+        standardized = WeatherDataProcessor.standardize_dataframe(raw, None)
+
+        assert (standardized.dtypes == np.float32).all()
+
+    def test_skips_unwanted_derived_variables(self) -> None:
+        """Test derived variables are only computed when requested."""
+        raw = pd.DataFrame(
+            {
+                "air_temperature_2m": [-5.0, 30.0],
+                "wind_speed_10m": [10.0, 2.0],
+                "relative_humidity_2m": [80.0, 70.0],
+            },
+            index=pd.date_range("2024-01-15", periods=2, freq="1h"),
+        )
+
+        standardized = WeatherDataProcessor.standardize_dataframe(
+            raw, None, {"temperature", "dew_point"}
+        )
+
+        assert "dew_point" in standardized.columns
+        assert "wind_chill" not in standardized.columns
+        assert "heat_index" not in standardized.columns